@@ -39,6 +39,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
+        "numpy>=1.20",
         "pandas>=1.0.2",
         "pyarrow>=10.0.0",
     ],
@@ -46,10 +47,16 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "filelock>=3.0.0",
             "black>=22.0.0",
             "mypy>=0.990",
             "flake8>=5.0.0",
         ],
+        # Optional C JSON encoder used by SwmmOutputEncoder.encode_to_json
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
         # Producer-side dependencies for emit_results_zarr (used by NEER
         # Console / WRM API). Heavy; not pulled in for plain decode/encode.
         "console": [
@@ -10,11 +10,15 @@ SWMM input models to various formats.
 from __future__ import annotations
 
 import json
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Optional, TextIO, Union, overload
+from typing import Any, Dict, List, Optional, TextIO, Union, overload
 
 from pandas import DataFrame
 
+# Template for empty list sections; callers get shallow copies of it
+_EMPTY_DATAFRAME = DataFrame()
+
 
 class SwmmInputEncoder:
     """Encode SWMM model dicts into .inp, .json, or .parquet file formats."""
@@ -130,14 +134,10 @@ class SwmmInputEncoder:
         Returns:
             JSON string
         """
-        with open(filepath, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(model, f, indent=2)
-            else:
-                json.dump(model, f)
-
-        # Return the JSON string for backwards compatibility
-        return json.dumps(model, indent=2 if pretty else None)
+        # Serialize once, write it in one call and return the same string
+        payload = json.dumps(model, indent=2 if pretty else None)
+        Path(filepath).write_text(payload, encoding="utf-8")
+        return payload
 
     @overload
     def encode_to_dataframe(self, model: Dict[str, Any], section: str) -> DataFrame: ...
@@ -160,14 +160,6 @@ class SwmmInputEncoder:
             Pandas DataFrame if section is specified, or Dict[str, DataFrame] for all sections.
             Only sections with list data (junctions, conduits, etc.) are included.
         """
-        try:
-            import pandas as pd
-        except ImportError as exc:
-            raise ImportError(
-                "pandas is required for DataFrame support. "
-                "Install with: pip install pandas"
-            ) from exc
-
         if section:
             # Return single dataframe for specified section
             if section not in model:
@@ -176,7 +168,7 @@ class SwmmInputEncoder:
             section_data = model[section]
             if isinstance(section_data, list):
                 # Both non-empty and empty lists return DataFrame
-                return pd.DataFrame(section_data)
+                return self._records_to_dataframe(section_data)
             # Non-list section cannot be converted to DataFrame
             raise ValueError(
                 f"Section '{section}' is not a list and cannot be converted to DataFrame"
@@ -185,13 +177,36 @@ class SwmmInputEncoder:
         # Return dict of dataframes for all sections with list data
         dataframes = {}
         for section_name, section_data in model.items():
-            if isinstance(section_data, list) and len(section_data) > 0:
-                dataframes[section_name] = pd.DataFrame(section_data)
-            elif isinstance(section_data, list):
-                # Include empty dataframes
-                dataframes[section_name] = pd.DataFrame()
+            if isinstance(section_data, list):
+                # Empty lists are included as empty DataFrames
+                dataframes[section_name] = self._records_to_dataframe(section_data)
         return dataframes
 
+    @staticmethod
+    def _records_to_dataframe(records: List[Any]) -> DataFrame:
+        """Build a DataFrame from a section's list of row dicts.
+
+        Sections parsed from .inp files usually have the same keys on every
+        row. Those rows are handed to pandas as tuples, which skips its
+        per-row dict key lookup; other lists fall back to pd.DataFrame.
+        Empty lists get a shallow copy of a shared empty DataFrame.
+        """
+        if not records:
+            return _EMPTY_DATAFRAME.copy(deep=False)
+
+        first = records[0]
+        if isinstance(first, dict) and len(first) > 1:
+            keys = list(first)
+            # Equal lengths plus no KeyError means every row has these keys
+            try:
+                lengths = set(map(len, records))
+                rows = list(map(itemgetter(*keys), records))
+            except (KeyError, TypeError):
+                rows = None
+            if rows is not None and lengths == {len(keys)}:
+                return DataFrame.from_records(rows, columns=keys)
+        return DataFrame(records)
+
     def encode_to_parquet(
         self, model: Dict[str, Any], output_path: str, single_file: bool = False
     ):
@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from .out_decoder import SwmmOutputDecoder
 from .out_encoder import SwmmOutputEncoder
 
@@ -79,8 +81,8 @@ class SwmmOutput:
         return self._data["metadata"]["n_periods"]
 
     @property
-    def time_index(self) -> List[datetime]:
-        """Get list of all time steps."""
+    def time_index(self) -> np.ndarray:
+        """Get all time steps as a datetime64[s] array."""
         return self._data["time_index"]
 
     @property
@@ -223,7 +225,10 @@ class SwmmOutput:
         )
 
     def to_parquet(
-        self, filepath: Union[str, Path, None] = None, single_file: bool = True
+        self,
+        filepath: Union[str, Path, None] = None,
+        single_file: bool = True,
+        chunk_size: int = 65536,
     ) -> None:
         """
         Export output file metadata to Parquet format.
@@ -233,9 +238,14 @@ class SwmmOutput:
                      this is treated as a directory path.
             single_file: Whether to save as single file (True) or multiple files (False).
                         If False, creates separate parquet files for each data type.
+            chunk_size: Rows per Parquet row group (default 65536)
         """
         self.encoder.encode_to_parquet(
-            self._data, filepath, single_file=single_file, summary_func=self.summary
+            self._data,
+            filepath,
+            single_file=single_file,
+            summary_func=self.summary,
+            chunk_size=chunk_size,
         )
 
     def to_dataframe(
@@ -6,11 +6,39 @@ into structured data. The .out files contain time series results from SWMM
 simulations including flows, depths, volumes, etc.
 """
 
+import mmap
+import os
 import struct
+import traceback
 from pathlib import Path
 from typing import Dict, Any, List, Union
 from datetime import datetime, timedelta
 
+import numpy as np
+
+
+class _BufferReader:
+    """File-like read/seek over a memoryview; reads return views, not copies."""
+
+    def __init__(self, buffer: memoryview):
+        self.buffer = buffer
+        self._pos = 0
+
+    def read(self, n: int) -> memoryview:
+        """Return the next n bytes (fewer at the end) and advance."""
+        chunk = self.buffer[self._pos : self._pos + n]
+        self._pos += len(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Move the read position, following the io seek conventions."""
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += len(self.buffer)
+        self._pos = min(max(offset, 0), len(self.buffer))
+        return self._pos
+
 
 class SwmmOutputDecoder:
     """Decoder for SWMM output (.out) binary files."""
@@ -24,6 +52,11 @@ class SwmmOutputDecoder:
     _LINK_TYPES = ["CONDUIT", "PUMP", "ORIFICE", "WEIR", "OUTLET"]
     _PROPERTY_LABELS = ["type", "area", "invert", "max_depth", "offset", "length"]
 
+    # Compiled once and shared by every decoder instance
+    _INT = struct.Struct("<i")
+    _FLOAT = struct.Struct("<f")
+    _DOUBLE = struct.Struct("<d")
+
     def decode_file(
         self, filepath: Union[str, Path], include_time_series: bool = False
     ) -> Dict[str, Any]:
@@ -42,32 +75,72 @@ class SwmmOutputDecoder:
         """
         filepath = Path(filepath)
 
-        with open(filepath, "rb") as f:
-            # Read header and metadata
-            header = self._parse_header(f)
-            metadata = self._parse_metadata(f, header)
+        with open(filepath, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                raise ValueError("Invalid .out file: file is empty")
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if include_time_series and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # The time series block is read front to back
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                data = self.decode_buffer(mm, include_time_series)
 
-            # Create time index
-            time_index = self._create_time_index(
-                metadata["start_date"],
-                metadata["report_interval"],
-                metadata["n_periods"],
-            )
+        data["filepath"] = str(filepath)
+        return data
+
+    def decode_buffer(
+        self, buffer: Any, include_time_series: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Decode a SWMM output file that is already in memory.
 
-            # Optionally read time series data
-            time_series = None
-            if include_time_series:
-                time_series = self._read_time_series_data(
-                    f, header, metadata, time_index
-                )
-
-            return {
-                "header": header,
-                "metadata": metadata,
-                "time_index": time_index,
-                "time_series": time_series,
-                "filepath": str(filepath),
-            }
+        Args:
+            buffer: Object supporting the buffer protocol (bytes, bytearray,
+                memoryview or mmap) holding the whole .out file. It is read
+                in place, without copying.
+            include_time_series: Whether to read and include time series data
+
+        Returns:
+            Same dictionary as decode_file, with "filepath" set to None
+        """
+        with memoryview(buffer) as view:
+            cast = view.cast("B")
+            reader = _BufferReader(cast)
+            try:
+                return self._decode(reader, include_time_series)
+            except Exception as exc:
+                # Finished frames in the traceback still hold slices of the
+                # buffer; drop them so the buffer (or mmap) can be released
+                traceback.clear_frames(exc.__traceback__)
+                raise
+            finally:
+                reader.buffer = None
+                cast.release()
+
+    def _decode(self, f: _BufferReader, include_time_series: bool) -> Dict[str, Any]:
+        """Decode an in-memory .out file."""
+        # Read header and metadata
+        header = self._parse_header(f)
+        metadata = self._parse_metadata(f, header)
+
+        # Create time index
+        time_index = self._create_time_index(
+            metadata["start_date"],
+            metadata["report_interval"],
+            metadata["n_periods"],
+        )
+
+        # Optionally read time series data
+        time_series = None
+        if include_time_series:
+            time_series = self._read_time_series_data(f, header, metadata, time_index)
+
+        return {
+            "header": header,
+            "metadata": metadata,
+            "time_index": time_index,
+            "time_series": time_series,
+            "filepath": None,
+        }
 
     def _parse_header(self, f) -> Dict[str, Any]:
         """Parse the binary file header."""
@@ -109,7 +182,7 @@ class SwmmOutputDecoder:
         f,
         header: Dict[str, Any],
         metadata: Dict[str, Any],
-        time_index: List[datetime],
+        time_index: np.ndarray,
     ) -> Dict[str, Any]:
         """
         Read time series data records from the binary file.
@@ -118,10 +191,10 @@ class SwmmOutputDecoder:
         Returns organized by element type and time step.
 
         Args:
-            f: File handle positioned after metadata
+            f: Reader over the in-memory .out file
             header: Parsed header information
             metadata: Parsed metadata information
-            time_index: List of timestamps
+            time_index: Array of datetime64 timestamps
 
         Returns:
             Dictionary with time series data organized by element type
@@ -153,8 +226,19 @@ class SwmmOutputDecoder:
         f.seek(-6 * self._RECORD_SIZE, 2)
         footer = self._read_n_ints(f, 6)
         results_pos = footer[2]
+        if results_pos < 0 or results_pos + n_periods * record_size > len(f.buffer):
+            raise ValueError("Invalid .out file: time series data is truncated")
+
+        # View every record as float32 slots, straight from the mapping. The
+        # first two slots of each record hold the timestamp double.
+        record_floats = record_size // 4
+        records = np.frombuffer(
+            f.buffer, dtype="<f4", count=n_periods * record_floats, offset=results_pos
+        ).reshape(n_periods, record_floats)
+
+        # Format every timestamp once rather than per element per period
+        timestamps = np.datetime_as_string(time_index, unit="s").tolist()
 
-        # Initialize storage for time series
         time_series = {
             "subcatchments": {},
             "nodes": {},
@@ -162,59 +246,28 @@ class SwmmOutputDecoder:
             "system": [],
         }
 
-        # Initialize nested structures for each element
-        for subcatch_label in metadata["labels"]["subcatchment"]:
-            time_series["subcatchments"][subcatch_label] = []
-
-        for node_label in metadata["labels"]["node"]:
-            time_series["nodes"][node_label] = []
-
-        for link_label in metadata["labels"]["link"]:
-            time_series["links"][link_label] = []
-
-        # Read all time step records
-        for period in range(n_periods):
-            # Seek to start of record, then skip the 8-byte timestamp
-            f.seek(results_pos + period * record_size + 8)
-
-            # Read subcatchment data
-            for subcatch_label in metadata["labels"]["subcatchment"]:
-                values = [self._read_float(f) for _ in range(n_subcatch_vars)]
-                time_series["subcatchments"][subcatch_label].append(
-                    {
-                        "timestamp": time_index[period].isoformat(),
-                        "values": values,
-                    }
-                )
-
-            # Read node data
-            for node_label in metadata["labels"]["node"]:
-                values = [self._read_float(f) for _ in range(n_node_vars)]
-                time_series["nodes"][node_label].append(
-                    {
-                        "timestamp": time_index[period].isoformat(),
-                        "values": values,
-                    }
-                )
-
-            # Read link data
-            for link_label in metadata["labels"]["link"]:
-                values = [self._read_float(f) for _ in range(n_link_vars)]
-                time_series["links"][link_label].append(
-                    {
-                        "timestamp": time_index[period].isoformat(),
-                        "values": values,
-                    }
-                )
-
-            # Read system data
-            system_values = [self._read_float(f) for _ in range(n_system_vars)]
-            time_series["system"].append(
-                {
-                    "timestamp": time_index[period].isoformat(),
-                    "values": system_values,
-                }
+        col = 2
+        for element_type, labels, n_vars in (
+            ("subcatchments", metadata["labels"]["subcatchment"], n_subcatch_vars),
+            ("nodes", metadata["labels"]["node"], n_node_vars),
+            ("links", metadata["labels"]["link"], n_link_vars),
+        ):
+            width = len(labels) * n_vars
+            block = records[:, col : col + width].reshape(
+                n_periods, len(labels), n_vars
             )
+            col += width
+            for i, label in enumerate(labels):
+                time_series[element_type][label] = [
+                    {"timestamp": timestamp, "values": values}
+                    for timestamp, values in zip(timestamps, block[:, i].tolist())
+                ]
+
+        system_values = records[:, col : col + n_system_vars].tolist()
+        time_series["system"] = [
+            {"timestamp": timestamp, "values": values}
+            for timestamp, values in zip(timestamps, system_values)
+        ]
 
         return time_series
 
@@ -290,6 +343,8 @@ class SwmmOutputDecoder:
         # Seek to end of file to read footer
         f.seek(-6 * self._RECORD_SIZE, 2)  # 6 integers at end
         footer = self._read_n_ints(f, 6)
+        if footer[5] != self._MAGIC_NUMBER:
+            raise ValueError("Invalid .out file: magic number mismatch at end")
         n_periods = footer[3]
 
         return {
@@ -353,8 +408,7 @@ class SwmmOutputDecoder:
             length = self._read_int(f)
             # Read string bytes
             if length > 0:
-                string_bytes = f.read(length)
-                string = string_bytes.decode("utf-8", errors="replace").rstrip("\x00")
+                string = str(f.read(length), "utf-8", "replace").rstrip("\x00")
                 strings.append(string)
             else:
                 strings.append("")
@@ -363,41 +417,52 @@ class SwmmOutputDecoder:
     def _excel_date_to_datetime(self, excel_date: float) -> datetime:
         """Convert Excel serial date to Python datetime.
 
-        Excel serial dates are days since 1899-12-30.
+        Excel serial dates are days since 1899-12-30. The result is rounded
+        to the nearest second, since serial dates rarely convert back to
+        whole seconds exactly.
         """
         try:
             base = datetime(1899, 12, 30)
-            return base + timedelta(days=excel_date)
+            date = base + timedelta(days=excel_date, microseconds=500000)
+            return date.replace(microsecond=0)
         except (ValueError, OverflowError):
             return datetime(2000, 1, 1, 0, 0)  # Default if invalid
 
     def _create_time_index(
         self, start_date: datetime, interval: timedelta, n_periods: int
-    ) -> List[datetime]:
-        """Create a list of datetime values for the time series."""
-        return [start_date + interval * i for i in range(n_periods)]
+    ) -> np.ndarray:
+        """Create a datetime64[s] array of reporting times for the time series."""
+        start = np.datetime64(start_date, "s")
+        step = np.timedelta64(int(interval.total_seconds()), "s")
+        return start + np.arange(n_periods) * step
 
     def _read_int(self, f) -> int:
         """Read a 4-byte integer from the file."""
         data = f.read(4)
         if len(data) < 4:
             return 0
-        return struct.unpack("<i", data)[0]
+        return self._INT.unpack(data)[0]
 
     def _read_n_ints(self, f, n: int) -> List[int]:
         """Read n 4-byte integers from the file."""
-        return [self._read_int(f) for _ in range(n)]
+        data = f.read(4 * n)
+        if len(data) < 4 * n:
+            # Truncated file: whole integers first, then zeros as _read_int does
+            whole = len(data) // 4
+            values = list(struct.unpack(f"<{whole}i", data[: 4 * whole]))
+            return values + [0] * (n - whole)
+        return list(struct.unpack(f"<{n}i", data))
 
     def _read_float(self, f) -> float:
         """Read a 4-byte float from the file."""
         data = f.read(4)
         if len(data) < 4:
             return 0.0
-        return struct.unpack("<f", data)[0]
+        return self._FLOAT.unpack(data)[0]
 
     def _read_double(self, f) -> float:
         """Read an 8-byte double from the file."""
         data = f.read(8)
         if len(data) < 8:
             return 0.0
-        return struct.unpack("<d", data)[0]
+        return self._DOUBLE.unpack(data)[0]
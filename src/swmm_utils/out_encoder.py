@@ -1,7 +1,8 @@
 """SWMM output file encoder - encode SWMM output data to .json or .parquet formats."""
 
 import json
-from typing import Any, Callable, Dict, Optional, Union
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from pathlib import Path
 
 
@@ -80,13 +81,35 @@ class SwmmOutputEncoder:
         if data.get("time_series") is not None:
             output_data["time_series"] = data["time_series"]
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(
-                output_data,
-                f,
-                indent=2 if pretty else None,
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        # orjson serializes in C and writes UTF-8 bytes directly; it emits
+        # null rather than NaN for non-finite floats
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            filepath.write_bytes(orjson.dumps(output_data, option=option))
+            return
+
+        # json.dumps builds the whole document in one pass; json.dump would
+        # issue a write per encoded chunk
+        indent = 2 if pretty else None
+        try:
+            text = json.dumps(
+                output_data, indent=indent, ensure_ascii=False, allow_nan=False
+            )
+        except ValueError:
+            # Write null for NaN/inf, as orjson does, instead of invalid JSON
+            text = json.dumps(
+                self._non_finite_to_none(output_data),
+                indent=indent,
                 ensure_ascii=False,
             )
+        filepath.write_text(text, encoding="utf-8")
 
     def encode_to_parquet(
         self,
@@ -94,6 +117,7 @@ class SwmmOutputEncoder:
         filepath: Union[str, Path, None] = None,
         single_file: bool = True,
         summary_func: Optional[Callable[[], Dict[str, Any]]] = None,
+        chunk_size: int = 65536,
     ) -> None:
         """
         Export output file metadata to Parquet format.
@@ -105,13 +129,11 @@ class SwmmOutputEncoder:
             single_file: Whether to save as single file (True) or multiple files (False).
                         If False, creates separate parquet files for each data type.
             summary_func: Optional callable to generate summary dict
+            chunk_size: Rows per Parquet row group. Each group is converted to
+                        Arrow and written on its own, bounding peak memory.
         """
-        try:
-            import pandas as pd
-        except ImportError as exc:
-            raise ImportError(
-                "pandas is required for Parquet export. Install with: pip install pandas"
-            ) from exc
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
 
         try:
             import pyarrow  # pylint: disable=unused-import # noqa: F401
@@ -120,6 +142,8 @@ class SwmmOutputEncoder:
                 "pyarrow is required for Parquet export. Install with: pip install pyarrow"
             ) from exc
 
+        summary = summary_func() if summary_func is not None else {}
+
         if single_file:
             # Export all metadata as a single parquet file
             if filepath is None:
@@ -127,17 +151,7 @@ class SwmmOutputEncoder:
             filepath = Path(filepath)
             filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create a summary dataframe
-            summary_data = []
-            summary = summary_func() if summary_func is not None else {}
-
-            for key, value in summary.items():
-                if isinstance(value, list):
-                    value = ", ".join(str(v) for v in value)
-                summary_data.append({"field": key, "value": str(value)})
-
-            df = pd.DataFrame(summary_data)
-            df.to_parquet(filepath, index=False)
+            self._write_parquet(self._summary_columns(summary), filepath, chunk_size)
         else:
             # Export as multiple parquet files in a directory
             if filepath is None:
@@ -145,57 +159,123 @@ class SwmmOutputEncoder:
             dirpath = Path(filepath)
             dirpath.mkdir(parents=True, exist_ok=True)
 
-            node_labels = data["metadata"]["labels"]["node"]
-            link_labels = data["metadata"]["labels"]["link"]
-            subcatch_labels = data["metadata"]["labels"]["subcatchment"]
-            node_props = data["metadata"]["properties"]["node"]
-            link_props = data["metadata"]["properties"]["link"]
-            subcatch_props = data["metadata"]["properties"]["subcatchment"]
-
-            # Export nodes
-            if node_labels:
-                nodes_data = []
-                for node_id in node_labels:
-                    if node_id in node_props:
-                        nodes_data.append({"id": node_id, **node_props[node_id]})
-                if nodes_data:
-                    df_nodes = pd.DataFrame(nodes_data)
-                    df_nodes.to_parquet(dirpath / "nodes.parquet", index=False)
-
-            # Export links
-            if link_labels:
-                links_data = []
-                for link_id in link_labels:
-                    if link_id in link_props:
-                        links_data.append({"id": link_id, **link_props[link_id]})
-                if links_data:
-                    df_links = pd.DataFrame(links_data)
-                    df_links.to_parquet(dirpath / "links.parquet", index=False)
-
-            # Export subcatchments
-            if subcatch_labels:
-                subcatch_data = []
-                for subcatch_id in subcatch_labels:
-                    if subcatch_id in subcatch_props:
-                        subcatch_data.append(
-                            {"id": subcatch_id, **subcatch_props[subcatch_id]}
-                        )
-                if subcatch_data:
-                    df_subcatch = pd.DataFrame(subcatch_data)
-                    df_subcatch.to_parquet(
-                        dirpath / "subcatchments.parquet", index=False
-                    )
+            labels = data["metadata"]["labels"]
+            properties = data["metadata"]["properties"]
+
+            # One file per element type, with an "id" column and one column
+            # per property
+            for element_type, filename in (
+                ("node", "nodes.parquet"),
+                ("link", "links.parquet"),
+                ("subcatchment", "subcatchments.parquet"),
+            ):
+                columns = self._element_columns(
+                    labels[element_type], properties[element_type]
+                )
+                if columns["id"]:
+                    self._write_parquet(columns, dirpath / filename, chunk_size)
 
             # Export summary
-            summary = summary_func() if summary_func is not None else {}
-            summary_data = []
-            for key, value in summary.items():
-                if isinstance(value, list):
-                    value = ", ".join(str(v) for v in value)
-                summary_data.append({"field": key, "value": str(value)})
+            self._write_parquet(
+                self._summary_columns(summary), dirpath / "summary.parquet", chunk_size
+            )
 
-            df_summary = pd.DataFrame(summary_data)
-            df_summary.to_parquet(dirpath / "summary.parquet", index=False)
+    @classmethod
+    def _non_finite_to_none(cls, value: Any) -> Any:
+        """Copy value with NaN and infinite floats replaced by None."""
+        if isinstance(value, float):
+            return value if math.isfinite(value) else None
+        if isinstance(value, dict):
+            return {k: cls._non_finite_to_none(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._non_finite_to_none(v) for v in value]
+        return value
+
+    @staticmethod
+    def _summary_columns(summary: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Flatten a summary dict into "field" and "value" string columns."""
+        if not summary:
+            return {}
+
+        values = []
+        for value in summary.values():
+            if isinstance(value, list):
+                value = ", ".join(str(v) for v in value)
+            values.append(str(value))
+        return {"field": list(summary), "value": values}
+
+    @staticmethod
+    def _element_columns(
+        labels: List[str], properties: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, List[Any]]:
+        """Pivot per-element property dicts into columns, led by "id"."""
+        ids = [label for label in labels if label in properties]
+        names = dict.fromkeys(name for label in ids for name in properties[label])
+
+        columns: Dict[str, List[Any]] = {"id": ids}
+        for name in names:
+            columns[name] = [properties[label].get(name) for label in ids]
+        return columns
+
+    @staticmethod
+    def _parquet_options(schema) -> Dict[str, Any]:
+        """
+        Writer options for a table schema.
+
+        zstd level 1 compresses better than the snappy default at similar
+        speed. Float columns use BYTE_STREAM_SPLIT, which groups the bytes
+        of each value so zstd finds more repetition; every other column
+        (ids, element types) is dictionary encoded.
+        """
+        import pyarrow.types as pa_types
+
+        floats = [field.name for field in schema if pa_types.is_floating(field.type)]
+        return {
+            "compression": "zstd",
+            "compression_level": 1,
+            "use_dictionary": [name for name in schema.names if name not in floats],
+            "column_encoding": {name: "BYTE_STREAM_SPLIT" for name in floats},
+        }
+
+    def _write_parquet(
+        self, columns: Dict[str, List[Any]], path: Path, chunk_size: int
+    ) -> None:
+        """
+        Write columns to a zstd-compressed Parquet file without pandas.
+
+        Rows are converted to Arrow and written one row group of chunk_size
+        rows at a time, so only one group's Arrow buffers exist at once. The
+        schema is inferred from the full columns before any group is written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        n_rows = len(next(iter(columns.values()), []))
+        if n_rows <= chunk_size:
+            table = pa.table(columns)
+            pq.write_table(
+                table,
+                path,
+                row_group_size=chunk_size,
+                **self._parquet_options(table.schema),
+            )
+            return
+
+        # Infer types over whole columns, so a column that is all None in the
+        # first chunk still gets the type of its later values
+        schema = pa.schema(
+            [(name, pa.infer_type(values)) for name, values in columns.items()]
+        )
+        with pq.ParquetWriter(path, schema, **self._parquet_options(schema)) as writer:
+            for start in range(0, n_rows, chunk_size):
+                chunk = pa.table(
+                    {
+                        name: values[start : start + chunk_size]
+                        for name, values in columns.items()
+                    },
+                    schema=schema,
+                )
+                writer.write_table(chunk, row_group_size=chunk_size)
 
     def encode_to_dataframe(
         self,
@@ -325,7 +405,7 @@ class SwmmOutputEncoder:
         time_series: Dict[str, Any],
         element_type: str,
         labels: list,
-        time_index: list,
+        time_index: Sequence,
     ):
         """Build MultiIndex DataFrame for a section (nodes, links, subcatchments).
 
@@ -333,7 +413,7 @@ class SwmmOutputEncoder:
             time_series: Time series data dict
             element_type: 'nodes', 'links', or 'subcatchments'
             labels: List of element labels/names
-            time_index: List of timestamps
+            time_index: Sequence of timestamps (list or datetime64 array)
 
         Returns:
             MultiIndex DataFrame with (timestamp, element_name) index
@@ -390,7 +470,7 @@ class SwmmOutputEncoder:
         time_series: Dict[str, Any],
         element_type: str,
         element_name: str,
-        time_index: list,
+        time_index: Sequence,
     ):
         """Build DataFrame for a single element's full time series.
 
@@ -398,7 +478,7 @@ class SwmmOutputEncoder:
             time_series: Time series data dict
             element_type: 'nodes', 'links', or 'subcatchments'
             element_name: Specific element name
-            time_index: List of timestamps
+            time_index: Sequence of timestamps (list or datetime64 array)
 
         Returns:
             DataFrame with timestamp index
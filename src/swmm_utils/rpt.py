@@ -5,7 +5,7 @@ This module provides a high-level interface for working with SWMM report (.rpt)
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from .rpt_decoder import SwmmReportDecoder
 
@@ -33,6 +33,8 @@ class SwmmReport:
         """
         self._data: Dict[str, Any] = {}
         self._decoder = SwmmReportDecoder()
+        # Name lookups built on first use, keyed by (section, name field)
+        self._name_index: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
 
         if filepath:
             self.load(filepath)
@@ -53,6 +55,7 @@ class SwmmReport:
             raise FileNotFoundError(f"Report file not found: {filepath}")
 
         self._data = self._decoder.decode_file(filepath)
+        self._name_index = {}
 
     def __enter__(self):
         """Context manager entry."""
@@ -187,10 +190,7 @@ class SwmmReport:
         Returns:
             Dictionary with node information or None if not found
         """
-        for node in self.node_depth:
-            if node["name"] == name:
-                return node
-        return None
+        return self._find_by_name("node_depth", "name", name)
 
     def get_link_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -202,10 +202,7 @@ class SwmmReport:
         Returns:
             Dictionary with link information or None if not found
         """
-        for link in self.link_flow:
-            if link["name"] == name:
-                return link
-        return None
+        return self._find_by_name("link_flow", "name", name)
 
     def get_subcatchment_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -217,10 +214,7 @@ class SwmmReport:
         Returns:
             Dictionary with subcatchment information or None if not found
         """
-        for sub in self.subcatchment_runoff:
-            if sub["name"] == name:
-                return sub
-        return None
+        return self._find_by_name("subcatchment_runoff", "name", name)
 
     def get_pump_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -232,10 +226,7 @@ class SwmmReport:
         Returns:
             Dictionary with pump information or None if not found
         """
-        for pump in self.pumping_summary:
-            if pump["pump_name"] == name:
-                return pump
-        return None
+        return self._find_by_name("pumping_summary", "pump_name", name)
 
     def get_storage_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -247,10 +238,24 @@ class SwmmReport:
         Returns:
             Dictionary with storage unit information or None if not found
         """
-        for storage in self.storage_volume:
-            if storage["storage_unit"] == name:
-                return storage
-        return None
+        return self._find_by_name("storage_volume", "storage_unit", name)
+
+    def _find_by_name(
+        self, section: str, field: str, name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the first row of a section whose name field matches.
+
+        The name index for each section is built once per loaded report, so
+        repeated lookups do not rescan the section's rows.
+        """
+        index = self._name_index.get((section, field))
+        if index is None:
+            index = {}
+            for row in self._data.get(section) or []:
+                index.setdefault(row[field], row)
+            self._name_index[(section, field)] = index
+        return index.get(name)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -4,9 +4,82 @@ SWMM Report File Decoder
 This module provides functionality to decode SWMM .rpt (report) files into structured data.
 """
 
+import io
+import mmap
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+# Dashed rule that closes the column-header block of a summary table
+_RE_TABLE_RULE = re.compile(r"\n[ \t]*-{5,}[\-\s]*\n", re.ASCII)
+
+# A single numeric report value, including SWMM's display forms
+# ('>50.00', '<0.01', '***', '-', 'N/A')
+_NUM = r"(?:[<>]?[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|\S*\*\S*|-|(?i:nan|n/a))"
+
+# Continuity table row, e.g. "Total Precipitation ......   8.176   6.655"
+_RE_CONTINUITY_ROW = re.compile(
+    r"([A-Za-z\s()%]+?)\s*\.+\s+([\d.><*-]+)\s+([\d.><*-]+)", re.ASCII
+)
+
+# Link Flow Summary row: name, type, max flow, days, hr:min, velocity,
+# max/full flow, max/full depth (any trailing columns are ignored)
+_RE_LINK_FLOW_ROW = re.compile(
+    rf"^[ \t]*(\S+)[ \t]+(\S+)[ \t]+({_NUM})[ \t]+(\d+)[ \t]+(\S+)"
+    rf"[ \t]+({_NUM})[ \t]+({_NUM})[ \t]+({_NUM})(?:[ \t]+\S+)*[ \t]*$",
+    re.MULTILINE | re.ASCII,
+)
+
+# Whole error and warning lines, e.g. "ERROR 317: cannot open ..."; group 1
+# is the line without its leading whitespace, group 2 the message kind
+_RE_MESSAGE_LINE = re.compile(
+    r"^[^\S\n]*((ERROR|WARNING)\s+\d+[^\n]*)",
+    re.IGNORECASE | re.MULTILINE | re.ASCII,
+)
+_RE_MESSAGE_LINE_BYTES = re.compile(
+    _RE_MESSAGE_LINE.pattern.encode("ascii"), re.IGNORECASE | re.MULTILINE
+)
+
+# Run of spaces separating a banner title from its unit/column labels
+_RE_COLUMN_GAP = re.compile(r"\s{2,}", re.ASCII)
+
+# Flow Classification Summary row: conduit name followed by 4 to 9 numeric
+# columns (any further columns are ignored)
+_RE_FLOW_CLASS_ROW = re.compile(
+    rf"^[ \t]*(\S+)((?:[ \t]+{_NUM}){{4,9}})(?:[ \t]+\S+)*[ \t]*$",
+    re.MULTILINE | re.ASCII,
+)
+
+# Result keys for the numeric Flow Classification Summary columns
+_FLOW_CLASS_FIELDS = (
+    "dry",
+    "up_dry",
+    "down_dry",
+    "sub_crit",
+    "sup_crit",
+    "up_crit",
+    "down_crit",
+    "norm_ltd",
+    "inlet_ctrl",
+)
+_FLOW_CLASS_KEYS = ("conduit",) + _FLOW_CLASS_FIELDS
+
+# Rewrites for _safe_float's special values so NumPy can parse them in bulk
+_RE_CAPPED_VALUE = re.compile(r"(?<!\S)[<>]", re.ASCII)
+_RE_OVERFLOW_VALUE = re.compile(r"\S*\*\S*", re.ASCII)
+_RE_MISSING_VALUE = re.compile(r"(?<!\S)(?:-|nan|n/a)(?!\S)", re.IGNORECASE | re.ASCII)
 
 
 def _safe_float(value: str) -> float:
@@ -56,9 +129,149 @@ def _safe_int(value: str) -> int:
     return int(s)
 
 
+def _normalize_numeric_text(text: str) -> str:
+    """
+    Rewrite SWMM display values in a block of numeric columns to plain numbers.
+
+    Applies the same rules as _safe_float to the whole block at once:
+    '>N'/'<N' become N, asterisk overflows become inf, and '-', 'NaN' and
+    'N/A' become 0.
+    """
+    text = _RE_CAPPED_VALUE.sub("", text)
+    text = _RE_OVERFLOW_VALUE.sub("inf", text)
+    return _RE_MISSING_VALUE.sub("0", text)
+
+
+def _table_body(section_text: str) -> str:
+    """
+    Return the data rows of a summary table.
+
+    Locates the dashed rule beneath the column headers once and slices
+    everything after it, so row loops need no per-line header checks.
+    Falls back to the whole text if no rule is found.
+    """
+    sep = _RE_TABLE_RULE.search(section_text)
+    return section_text[sep.end() :] if sep else section_text
+
+
+def _section_text(content: str, title: str) -> str:
+    """
+    Return the text of a summary section after its first dashed rule.
+
+    The section is located with str.find rather than a lazy DOTALL pattern:
+    it runs from the line after the first rule following the title up to
+    the next blank line, or the end of the text. Returns "" if the title or
+    rule is missing.
+    """
+    start = content.find(title)
+    if start < 0:
+        return ""
+    rule = content.find("-", start + len(title))
+    if rule < 0:
+        return ""
+    begin = content.find("\n", rule) + 1
+    if not begin:
+        return ""
+
+    pos = begin
+    size = len(content)
+    while pos < size:
+        eol = content.find("\n", pos)
+        if eol < 0:
+            eol = size
+        if not content[pos:eol].strip():
+            break
+        pos = eol + 1
+    return content[begin:pos].strip()
+
+
+def _iter_report_blocks(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Split a report into (title, text) blocks, one per section banner.
+
+    A block runs from the opening row of stars of a section banner up to the
+    next banner, and its title is the first banner line without any trailing
+    unit labels (e.g. "Runoff Quantity Continuity"). Text before the first
+    banner is yielded with an empty title. Each block also carries the opening
+    row of the next banner, so section patterns that look ahead for it still
+    match. Only the current block is held in memory.
+    """
+    title = ""
+    block: List[str] = []
+    in_banner = False
+
+    for line in lines:
+        if line.lstrip().startswith("*"):
+            if in_banner:
+                in_banner = False
+            else:
+                yield title, "".join(block) + line
+                title = ""
+                block = []
+                in_banner = True
+        elif in_banner and not title:
+            title = _RE_COLUMN_GAP.split(line.strip(), 1)[0]
+        block.append(line)
+
+    yield title, "".join(block)
+
+
 class SwmmReportDecoder:
     """Decoder for SWMM report (.rpt) files."""
 
+    # Section parsers in report order as (result key, method name, block title).
+    # Each parser is given the report block whose banner carries its title;
+    # "" is the text before the first banner and None the final block.
+    # Continuity has two blocks whose results are merged.
+    _PARSERS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+        ("header", "_parse_header", ""),
+        ("element_count", "_parse_element_count", "Element Count"),
+        ("analysis_options", "_parse_analysis_options", "Analysis Options"),
+        ("continuity", "_parse_continuity", "Runoff Quantity Continuity"),
+        ("continuity", "_parse_continuity", "Flow Routing Continuity"),
+        (
+            "subcatchment_runoff",
+            "_parse_subcatchment_runoff",
+            "Subcatchment Runoff Summary",
+        ),
+        ("node_depth", "_parse_node_depth", "Node Depth Summary"),
+        ("node_inflow", "_parse_node_inflow", "Node Inflow Summary"),
+        ("node_flooding", "_parse_node_flooding", "Node Flooding Summary"),
+        ("node_surcharge", "_parse_node_surcharge", "Node Surcharge Summary"),
+        ("storage_volume", "_parse_storage_volume", "Storage Volume Summary"),
+        ("outfall_loading", "_parse_outfall_loading", "Outfall Loading Summary"),
+        ("link_flow", "_parse_link_flow", "Link Flow Summary"),
+        (
+            "flow_classification",
+            "_parse_flow_classification",
+            "Flow Classification Summary",
+        ),
+        ("conduit_surcharge", "_parse_conduit_surcharge", "Conduit Surcharge Summary"),
+        ("pumping_summary", "_parse_pumping_summary", "Pumping Summary"),
+        ("lid_performance", "_parse_lid_performance", "LID Performance Summary"),
+        ("groundwater_summary", "_parse_groundwater_summary", "Groundwater Continuity"),
+        (
+            "quality_routing_continuity",
+            "_parse_quality_routing_continuity",
+            "Quality Routing Continuity",
+        ),
+        (
+            "subcatchment_washoff",
+            "_parse_subcatchment_washoff",
+            "Subcatchment Washoff Summary",
+        ),
+        (
+            "link_pollutant_load",
+            "_parse_link_pollutant_load",
+            "Link Pollutant Load Summary",
+        ),
+        ("analysis_time", "_parse_analysis_time", None),
+    )
+
+    _PARSERS_BY_TITLE: Dict[str, Tuple[str, str]] = {
+        title: (key, method) for key, method, title in _PARSERS if title is not None
+    }
+
     def decode_file(self, filepath: Union[str, Path]) -> Dict[str, Any]:
         """
         Decode a SWMM report file.
@@ -72,35 +285,83 @@ class SwmmReportDecoder:
         filepath = Path(filepath)
 
         with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-
-        report_data = {
-            "header": self._parse_header(content),
-            "element_count": self._parse_element_count(content),
-            "analysis_options": self._parse_analysis_options(content),
-            "continuity": self._parse_continuity(content),
-            "subcatchment_runoff": self._parse_subcatchment_runoff(content),
-            "node_depth": self._parse_node_depth(content),
-            "node_inflow": self._parse_node_inflow(content),
-            "node_flooding": self._parse_node_flooding(content),
-            "node_surcharge": self._parse_node_surcharge(content),
-            "storage_volume": self._parse_storage_volume(content),
-            "outfall_loading": self._parse_outfall_loading(content),
-            "link_flow": self._parse_link_flow(content),
-            "flow_classification": self._parse_flow_classification(content),
-            "conduit_surcharge": self._parse_conduit_surcharge(content),
-            "pumping_summary": self._parse_pumping_summary(content),
-            "lid_performance": self._parse_lid_performance(content),
-            "groundwater_summary": self._parse_groundwater_summary(content),
-            "quality_routing_continuity": self._parse_quality_routing_continuity(
-                content
-            ),
-            "subcatchment_washoff": self._parse_subcatchment_washoff(content),
-            "link_pollutant_load": self._parse_link_pollutant_load(content),
-            "analysis_time": self._parse_analysis_time(content),
-            "errors": self._parse_errors(content),
-            "warnings": self._parse_warnings(content),
-        }
+            return self.decode(f)
+
+    def decode_messages(self, filepath: Union[str, Path]) -> Dict[str, List[str]]:
+        """
+        Extract only the ERROR and WARNING lines from a SWMM report file.
+
+        The file is memory-mapped and scanned as bytes, so large reports are
+        neither read into a string nor decoded when no other section is needed.
+
+        Args:
+            filepath: Path to the .rpt file
+
+        Returns:
+            Dictionary with "errors" and "warnings" lists, as in decode_file
+        """
+        filepath = Path(filepath)
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        with open(filepath, "rb") as f:
+            # Zero-length files cannot be mapped
+            if filepath.stat().st_size == 0:
+                return {"errors": errors, "warnings": warnings}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in _RE_MESSAGE_LINE_BYTES.finditer(mm):
+                    line = match.group(1).decode("utf-8", errors="ignore").rstrip()
+                    if match.group(2).upper() == b"ERROR":
+                        errors.append(line)
+                    else:
+                        warnings.append(line)
+
+        return {"errors": errors, "warnings": warnings}
+
+    def decode(self, file: TextIO) -> Dict[str, Any]:
+        """
+        Decode a SWMM report from a file object.
+
+        The report is read one section at a time, so memory use is bounded by
+        the largest section rather than the size of the whole report.
+
+        Args:
+            file: File object (or any iterable of lines) to read from
+
+        Returns:
+            Dictionary containing parsed report data
+        """
+        parsed: Dict[str, Any] = {}
+        errors: List[str] = []
+        warnings: List[str] = []
+        text = ""
+
+        for title, text in _iter_report_blocks(file):
+            entry = self._PARSERS_BY_TITLE.get(title)
+            if entry is not None:
+                key, method = entry
+                result = getattr(self, method)(text)
+                if isinstance(parsed.get(key), dict) and isinstance(result, dict):
+                    parsed[key].update(result)
+                else:
+                    parsed[key] = result
+
+            block_errors, block_warnings = self._parse_errors_and_warnings(text)
+            errors.extend(block_errors)
+            warnings.extend(block_warnings)
+
+        # Analysis timing lines follow the last section
+        parsed["analysis_time"] = self._parse_analysis_time(text)
+
+        # Sections missing from the report get their parser's empty result
+        report_data = {}
+        for key, method, _ in self._PARSERS:
+            if key not in report_data:
+                report_data[key] = (
+                    parsed[key] if key in parsed else getattr(self, method)("")
+                )
+        report_data["errors"] = errors
+        report_data["warnings"] = warnings
 
         return report_data
 
@@ -238,9 +499,7 @@ class SwmmReportDecoder:
                 continue
 
             # Match lines like "Total Precipitation ......         8.176         6.655"
-            match = re.match(
-                r"([A-Za-z\s()%]+?)\s*\.+\s+([\d.><*-]+)\s+([\d.><*-]+)", line
-            )
+            match = _RE_CONTINUITY_ROW.match(line)
             if match:
                 key = (
                     match.group(1)
@@ -276,20 +535,20 @@ class SwmmReportDecoder:
             # Skip header lines
             data_started = False
             for line in lines:
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                # Header line starts with "Subcatchment" with values in the line
-                if line.startswith("Subcatchment") and not (
-                    "Precip" in line or "Runon" in line
-                ):
-                    data_started = True
+                # Split the raw line: split() skips the indentation itself, so
+                # no stripped copy of the line is made
+                parts = line.split()
+                if not parts or parts[0][:1] == "-":
                     continue
+                # Header lines are only checked until the column-name row
+                # (starting "Subcatchment" without value labels) is seen
                 if not data_started:
+                    data_started = parts[0].startswith("Subcatchment") and not (
+                        "Precip" in line or "Runon" in line
+                    )
                     continue
 
                 # Parse data lines
-                parts = line.split()
                 if len(parts) >= 10:
                     try:
                         subcatchments.append(
@@ -328,16 +587,13 @@ class SwmmReportDecoder:
 
             data_started = False
             for line in lines:
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                if "Node" in line and "Type" in line:
-                    data_started = True
+                parts = line.split()
+                if not parts or parts[0][:1] == "-":
                     continue
                 if not data_started:
+                    data_started = "Node" in line and "Type" in line
                     continue
 
-                parts = line.split()
                 if len(parts) >= 7:
                     try:
                         nodes.append(
@@ -373,16 +629,13 @@ class SwmmReportDecoder:
 
             data_started = False
             for line in lines:
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                if "Node" in line and "Type" in line:
-                    data_started = True
+                parts = line.split()
+                if not parts or parts[0][:1] == "-":
                     continue
                 if not data_started:
+                    data_started = "Node" in line and "Type" in line
                     continue
 
-                parts = line.split()
                 if len(parts) >= 8:
                     try:
                         nodes.append(
@@ -431,18 +684,13 @@ class SwmmReportDecoder:
         lines = section_text.split("\n")
         data_started = False
         for line in lines:
-            line = line.strip()
-            if not line or line.startswith("-"):
-                continue
-            if "Node" in line and "Flooded" in line:
-                data_started = True
-                continue
-            if "Flooding refers to" in line:
+            parts = line.split()
+            if not parts or parts[0][:1] == "-":
                 continue
             if not data_started:
+                data_started = "Node" in line and "Flooded" in line
                 continue
 
-            parts = line.split()
             if len(parts) >= 7:
                 try:
                     flooded_nodes.append(
@@ -474,20 +722,9 @@ class SwmmReportDecoder:
         )
 
         if section_match:
-            section_text = section_match.group(1)
-            lines = section_text.strip().split("\n")
-
-            data_started = False
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                if "Outfall Node" in line:
-                    data_started = True
-                    continue
-                if not data_started:
-                    continue
+            body = _table_body(section_match.group(1).strip())
 
+            for line in body.split("\n"):
                 parts = line.split()
                 if len(parts) >= 4 and parts[0] != "System":
                     try:
@@ -512,50 +749,46 @@ class SwmmReportDecoder:
 
     def _parse_link_flow(self, content: str) -> List[Dict[str, Any]]:
         """Parse link flow summary."""
-        links = []
-
         section_match = re.search(
             r"Link Flow Summary\s*\*+(.+?)(?=\n\s*\n\s*\*+)", content, re.DOTALL
         )
 
-        if section_match:
-            section_text = section_match.group(1)
-            lines = section_text.strip().split("\n")
-
-            data_started = False
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                if "Link" in line and "Type" in line:
-                    data_started = True
-                    continue
-                if not data_started:
-                    continue
-
-                parts = line.split()
-                if len(parts) >= 8:
-                    try:
-                        links.append(
-                            {
-                                "name": parts[0],
-                                "type": parts[1],
-                                "maximum_flow": _safe_float(parts[2]),
-                                "time_of_max_days": _safe_int(parts[3]),
-                                "time_of_max": parts[4],
-                                "maximum_velocity": _safe_float(parts[5]),
-                                "max_over_full_flow": (
-                                    _safe_float(parts[6]) if len(parts) > 6 else None
-                                ),
-                                "max_over_full_depth": (
-                                    _safe_float(parts[7]) if len(parts) > 7 else None
-                                ),
-                            }
-                        )
-                    except (ValueError, IndexError):
-                        continue
-
-        return links
+        if not section_match:
+            return []
+
+        body = _table_body(section_match.group(1).strip())
+
+        # Keep the text columns in Python and batch the numeric ones into a
+        # single NumPy parse instead of one _safe_float call per value
+        names, types, times, rows = [], [], [], []
+        for match in _RE_LINK_FLOW_ROW.finditer(body):
+            names.append(match.group(1))
+            types.append(match.group(2))
+            times.append(match.group(5))
+            rows.append(" ".join(match.group(3, 4, 6, 7, 8)))
+
+        if not rows:
+            return []
+
+        values = np.loadtxt(
+            io.StringIO(_normalize_numeric_text("\n".join(rows))),
+            dtype=np.float64,
+            ndmin=2,
+        ).tolist()
+
+        return [
+            {
+                "name": name,
+                "type": link_type,
+                "maximum_flow": row[0],
+                "time_of_max_days": int(row[1]),
+                "time_of_max": time_of_max,
+                "maximum_velocity": row[2],
+                "max_over_full_flow": row[3],
+                "max_over_full_depth": row[4],
+            }
+            for name, link_type, time_of_max, row in zip(names, types, times, values)
+        ]
 
     def _parse_conduit_surcharge(self, content: str) -> Optional[str]:
         """Parse conduit surcharge summary."""
@@ -600,31 +833,9 @@ class SwmmReportDecoder:
         if not section_match:
             return pumps
 
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines, separators, and any header-related lines
-            if (
-                not line
-                or line.startswith("-")
-                or "Pump" in line
-                or "Percent" in line
-                or "Number" in line
-                or "Flow" in line
-                or "Utilized" in line
-                or "Min" in line
-                or "Avg" in line
-                or "Max" in line
-                or "Total" in line
-                or "Power" in line
-                or "Time" in line
-                or "Curve" in line
-                or "Start-Ups" in line
-            ):
-                continue
+        body = _table_body(section_match.group(1).strip())
 
+        for line in body.split("\n"):
             parts = line.split()
             if len(parts) >= 10:
                 try:
@@ -660,14 +871,9 @@ class SwmmReportDecoder:
         if not section_match:
             return storages
 
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("-") or "Storage Unit" in line:
-                continue
+        body = _table_body(section_match.group(1).strip())
 
+        for line in body.split("\n"):
             parts = line.split()
             if len(parts) >= 9:
                 try:
@@ -705,19 +911,9 @@ class SwmmReportDecoder:
         if not section_match:
             return nodes
 
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if (
-                not line
-                or line.startswith("-")
-                or "Node" in line
-                or "Surcharging occurs" in line
-            ):
-                continue
+        body = _table_body(section_match.group(1).strip())
 
+        for line in body.split("\n"):
             parts = line.split()
             if len(parts) >= 5:
                 try:
@@ -748,14 +944,9 @@ class SwmmReportDecoder:
         if not section_match:
             return lid_controls
 
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("-") or "Subcatchment" in line:
-                continue
+        body = _table_body(section_match.group(1).strip())
 
+        for line in body.split("\n"):
             parts = line.split()
             if len(parts) >= 10:
                 try:
@@ -794,14 +985,16 @@ class SwmmReportDecoder:
 
         # Parse groundwater data
         for line in section_text.split("\n"):
-            if "......" in line or "....." in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    key = "_".join(parts[:-2]).lower().replace(".", "")
+            if "....." in line:
+                # Only the label and the first value column are used, so
+                # split off just the two right-most fields
+                parts = line.rsplit(None, 2)
+                if len(parts) == 3:
+                    key = "_".join(parts[0].split()).lower().replace(".", "")
                     try:
-                        gw_data[key] = _safe_float(parts[-2])
+                        gw_data[key] = _safe_float(parts[1])
                     except ValueError:
-                        gw_data[key] = parts[-2]
+                        gw_data[key] = parts[1]
 
         return gw_data if gw_data else None
 
@@ -823,151 +1016,144 @@ class SwmmReportDecoder:
 
         # Parse quality routing data
         for line in section_text.split("\n"):
-            if "......" in line or "....." in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    key = "_".join(parts[:-2]).lower().replace(".", "")
+            if "....." in line:
+                # Only the label and the first value column are used, so
+                # split off just the two right-most fields
+                parts = line.rsplit(None, 2)
+                if len(parts) == 3:
+                    key = "_".join(parts[0].split()).lower().replace(".", "")
                     try:
-                        qr_data[key] = _safe_float(parts[-2])
+                        qr_data[key] = _safe_float(parts[1])
                     except ValueError:
-                        qr_data[key] = parts[-2]
+                        qr_data[key] = parts[1]
 
         return qr_data if qr_data else None
 
     def _parse_subcatchment_washoff(self, content: str) -> List[Dict[str, Any]]:
         """Parse subcatchment washoff summary section."""
-        washoffs = []
-
-        section_match = re.search(
-            r"Subcatchment Washoff Summary\s*\*+.+?-+\s*(.+?)(?=\n\s*\n\s*\*+|\Z)",
-            content,
-            re.DOTALL,
+        return self._parse_pollutant_table(
+            content, "Subcatchment Washoff Summary", "subcatchment"
         )
 
-        if not section_match:
-            return washoffs
-
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
-
-        # Parse washoff data - structure varies by pollutants present
-        # This is a simplified parser
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("-") or "Subcatchment" in line:
-                continue
-
-            parts = line.split()
-            if len(parts) >= 2:
-                washoffs.append({"subcatchment": parts[0], "data": parts[1:]})
-
-        return washoffs
-
     def _parse_link_pollutant_load(self, content: str) -> List[Dict[str, Any]]:
         """Parse link pollutant load summary section."""
-        loads = []
-
-        section_match = re.search(
-            r"Link Pollutant Load Summary\s*\*+.+?-+\s*(.+?)(?=\n\s*\n\s*\*+|\Z)",
-            content,
-            re.DOTALL,
+        return self._parse_pollutant_table(
+            content, "Link Pollutant Load Summary", "link"
         )
 
-        if not section_match:
-            return loads
+    def _parse_pollutant_table(
+        self, content: str, title: str, name_key: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse a summary table with one value column per pollutant.
 
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
+        The pollutant names are read once from the column header, so every
+        row maps straight to {pollutant: value} without re-checking headers.
 
-        # Parse load data - structure varies by pollutants present
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("-") or "Link" in line:
+        Returns:
+            List of dicts with the element name under name_key, the raw
+            "data" strings and the parsed "loads" keyed by pollutant
+        """
+        rows: List[Dict[str, Any]] = []
+
+        section_text = _section_text(content, title)
+        if not section_text:
+            return rows
+
+        # The first of the two header lines names the pollutants; the second
+        # holds the element column label and the units
+        sep = _RE_TABLE_RULE.search(section_text)
+        if sep:
+            header_lines = section_text[: sep.start()].split("\n")
+            body = section_text[sep.end() :]
+        else:
+            header_lines = []
+            body = section_text
+        pollutants = header_lines[0].split() if len(header_lines) > 1 else []
+
+        for line in body.split("\n"):
+            # Split the name off first so the values list is built directly
+            # rather than sliced from a list of every field; split() skips
+            # the indentation, so the line is never strip()ped
+            parts = line.split(None, 1)
+            if len(parts) < 2 or parts[0][:1] == "-":
                 continue
 
-            parts = line.split()
-            if len(parts) >= 2:
-                loads.append({"link": parts[0], "data": parts[1:]})
+            data = parts[1].split()
+            try:
+                loads = dict(zip(pollutants, map(_safe_float, data)))
+            except ValueError:
+                loads = {}
+            rows.append({name_key: parts[0], "data": data, "loads": loads})
 
-        return loads
+        return rows
 
     def _parse_flow_classification(self, content: str) -> List[Dict[str, Any]]:
         """Parse flow classification summary section."""
-        classifications = []
+        columns = self._parse_flow_classification_columns(content)
 
-        section_match = re.search(
-            r"Flow Classification Summary\s*\*+.+?-+\s*(.+?)(?=\n\s*\n\s*\*+|\Z)",
-            content,
-            re.DOTALL,
+        # Missing values become None column-wise, so each record is a plain
+        # zip of the keys with one row of values
+        fields = (
+            np.where(np.isnan(columns[field]), None, columns[field]).tolist()
+            for field in _FLOW_CLASS_FIELDS
         )
+        return [
+            dict(zip(_FLOW_CLASS_KEYS, row)) for row in zip(columns["conduit"], *fields)
+        ]
 
-        if not section_match:
-            return classifications
-
-        section_text = section_match.group(1).strip()
-        lines = section_text.split("\n")
+    def _parse_flow_classification_columns(self, content: str) -> Dict[str, Any]:
+        """
+        Parse flow classification summary section into columns.
 
-        for line in lines:
-            line = line.strip()
-            if (
-                not line
-                or line.startswith("-")
-                or "Conduit" in line
-                or "Adjusted" in line
-                or "Fraction of Time" in line
-            ):
-                continue
+        Returns:
+            Dictionary with a "conduit" list of names and one float64 array
+            per fraction field (NaN where a row has no value)
+        """
+        columns: Dict[str, Any] = {"conduit": []}
+        body = _table_body(_section_text(content, "Flow Classification Summary"))
+
+        rows = []
+        for match in _RE_FLOW_CLASS_ROW.finditer(body):
+            columns["conduit"].append(match.group(1))
+            rows.append(match.group(2))
+
+        n_fields = len(_FLOW_CLASS_FIELDS)
+        values = np.full((len(rows), n_fields), np.nan)
+        if rows:
+            # Parse every fraction column in one NumPy call. SWMM prints the
+            # same number of columns on every row, so rows only need padding
+            # to a rectangle when that parse fails.
+            text = _normalize_numeric_text("\n".join(rows))
+            try:
+                parsed = np.loadtxt(io.StringIO(text), dtype=np.float64, ndmin=2)
+            except ValueError:
+                text = "\n".join(
+                    row + " nan" * (n_fields - len(row.split()))
+                    for row in text.split("\n")
+                )
+                parsed = np.loadtxt(io.StringIO(text), dtype=np.float64, ndmin=2)
+            values[:, : parsed.shape[1]] = parsed
 
-            parts = line.split()
-            if len(parts) >= 5:
-                try:
-                    classifications.append(
-                        {
-                            "conduit": parts[0],
-                            "dry": _safe_float(parts[1]),
-                            "up_dry": _safe_float(parts[2]) if len(parts) > 2 else None,
-                            "down_dry": (
-                                _safe_float(parts[3]) if len(parts) > 3 else None
-                            ),
-                            "sub_crit": (
-                                _safe_float(parts[4]) if len(parts) > 4 else None
-                            ),
-                            "sup_crit": (
-                                _safe_float(parts[5]) if len(parts) > 5 else None
-                            ),
-                            "up_crit": (
-                                _safe_float(parts[6]) if len(parts) > 6 else None
-                            ),
-                            "down_crit": (
-                                _safe_float(parts[7]) if len(parts) > 7 else None
-                            ),
-                            "norm_ltd": (
-                                _safe_float(parts[8]) if len(parts) > 8 else None
-                            ),
-                            "inlet_ctrl": (
-                                _safe_float(parts[9]) if len(parts) > 9 else None
-                            ),
-                        }
-                    )
-                except (ValueError, IndexError):
-                    continue
+        for i, field in enumerate(_FLOW_CLASS_FIELDS):
+            columns[field] = values[:, i]
 
-        return classifications
+        return columns
 
-    def _parse_errors(self, content: str) -> List[str]:
-        """Parse ERROR lines from the report."""
+    def _parse_errors_and_warnings(self, content: str) -> Tuple[List[str], List[str]]:
+        """Parse ERROR and WARNING lines from the report in a single pass."""
         errors = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if re.match(r"ERROR\s+\d+", stripped, re.IGNORECASE):
-                errors.append(stripped)
-        return errors
-
-    def _parse_warnings(self, content: str) -> List[str]:
-        """Parse WARNING lines from the report."""
         warnings = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if re.match(r"WARNING\s+\d+", stripped, re.IGNORECASE):
-                warnings.append(stripped)
-        return warnings
+
+        # Most report blocks hold no messages; a case-insensitive substring
+        # test is far cheaper than running the line regex over the block
+        upper = content.upper()
+        if "ERROR" not in upper and "WARNING" not in upper:
+            return errors, warnings
+
+        for match in _RE_MESSAGE_LINE.finditer(content):
+            if match.group(2).upper() == "ERROR":
+                errors.append(match.group(1).rstrip())
+            else:
+                warnings.append(match.group(1).rstrip())
+        return errors, warnings
@@ -0,0 +1,162 @@
+"""Shared pytest fixtures for the SWMM Utils test suite."""
+
+import contextlib
+import functools
+import json
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+
+import pytest
+
+from swmm_utils import SwmmOutput, SwmmOutputDecoder
+
+# Get the examples directory
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+EXAMPLE1_OUT = EXAMPLES_DIR / "example1" / "example1.out"
+
+
+# The decoder keeps no per-file state, so one instance serves the whole run
+_DECODER = SwmmOutputDecoder()
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_decode(path: Path, _mtime_ns: int, _size: int) -> dict:
+    """Decode an .out file once per (path, mtime, size).
+
+    mtime and size are only cache keys, so an edited file is decoded again.
+    """
+    return _DECODER.decode_file(path)
+
+
+@pytest.fixture(scope="session")
+def decoder():
+    """The shared SwmmOutputDecoder instance."""
+    return _DECODER
+
+
+def _replace_atomically(path: Path, write) -> None:
+    """Write a file under a temporary name, then move it into place."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _dump(path: Path, obj) -> None:
+    """Pickle obj with protocol 5, keeping its buffers out of band.
+
+    The pickle stream goes to path and the raw buffers to
+    path.with_suffix(".buffers.bin"), behind a header of buffer lengths.
+    """
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    views = [buf.raw() for buf in buffers]
+
+    def write_buffers(f):
+        f.write(struct.pack(f"<Q{len(views)}Q", len(views), *(v.nbytes for v in views)))
+        for view in views:
+            f.write(view)
+
+    # The pickle is written last so its presence means the buffers are complete
+    _replace_atomically(path.with_suffix(".buffers.bin"), write_buffers)
+    _replace_atomically(path, lambda f: f.write(payload))
+
+
+def _load(path: Path):
+    """Unpickle a _dump file, backing its buffers with a read-only mmap."""
+    with open(path.with_suffix(".buffers.bin"), "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # The mapping is deliberately not closed here: the arrays rebuilt by
+    # pickle.loads are views into it, and the slices they hold keep it alive.
+    # It is unmapped once the returned object (the session's example_data)
+    # is garbage collected. Only the top-level view is released now.
+    with memoryview(mapped) as view:
+        (count,) = struct.unpack_from("<Q", view)
+        sizes = struct.unpack_from(f"<{count}Q", view, 8)
+        offset = 8 * (count + 1)
+        buffers = []
+        for size in sizes:
+            buffers.append(view[offset : offset + size])
+            offset += size
+
+    return pickle.loads(path.read_bytes(), buffers=buffers)
+
+
+@pytest.fixture(scope="session")
+def example_data(tmp_path_factory):
+    """Decoded example1.out, shared by every test in the session.
+
+    Under pytest-xdist the first worker to decode the file pickles it into
+    the run's shared temp directory and the other workers load that copy.
+    With filelock installed, the other workers wait for that first decode
+    instead of racing it.
+    Tests must treat the returned dict as read-only.
+    """
+    if not EXAMPLE1_OUT.exists():
+        pytest.skip("example1.out not found")
+
+    stat = EXAMPLE1_OUT.stat()
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return _cached_decode(EXAMPLE1_OUT, stat.st_mtime_ns, stat.st_size)
+
+    # Each worker's basetemp is a child of one directory per test run
+    cache = tmp_path_factory.getbasetemp().parent / (
+        f"example1-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+    )
+    try:
+        from filelock import FileLock
+    except ImportError:
+        # Without a lock, racing workers may each decode; the atomic writes
+        # in _dump keep the cache consistent either way
+        lock = contextlib.nullcontext()
+    else:
+        lock = FileLock(f"{cache}.lock")
+
+    with lock:
+        if cache.exists():
+            return _load(cache)
+
+        data = _cached_decode(EXAMPLE1_OUT, stat.st_mtime_ns, stat.st_size)
+        _dump(cache, data)
+        return data
+
+
+@pytest.fixture(scope="session")
+def example1_output():
+    """SwmmOutput for example1.out without time series, shared read-only."""
+    if not EXAMPLE1_OUT.exists():
+        pytest.skip("example1.out not found")
+    return SwmmOutput(EXAMPLE1_OUT)
+
+
+@pytest.fixture(scope="session")
+def example1_output_with_ts():
+    """SwmmOutput for example1.out with time series loaded, shared read-only."""
+    if not EXAMPLE1_OUT.exists():
+        pytest.skip("example1.out not found")
+    return SwmmOutput(EXAMPLE1_OUT, load_time_series=True)
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(path.read_bytes())
+    return orjson.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def read_json():
+    """Callable that parses an exported JSON file for assertions."""
+    return _load_json
+
+
+@pytest.fixture(scope="session")
+def parquet_dir(tmp_path_factory):
+    """One directory for all Parquet export tests; each test uses its own name."""
+    return tmp_path_factory.mktemp("parquet")
@@ -4,6 +4,7 @@ Tests the SwmmInput class which provides typed properties and
 context manager support for working with SWMM models.
 """
 
+import numpy as np
 import pytest
 from pathlib import Path
 from swmm_utils import SwmmInput
@@ -720,225 +721,191 @@ def test_input_export_parquet_creates_directory(tmp_path):
 
 
 # DATAFRAME TESTS
-def test_input_to_dataframe_single_section():
-    """Test exporting a single section to DataFrame."""
-    pd = pytest.importorskip("pandas")
-
-    with SwmmInput() as inp:
-        inp.junctions = [
-            {"name": "J1", "elevation": 100, "max_depth": 5},
-            {"name": "J2", "elevation": 95, "max_depth": 6},
-        ]
-
-        df = inp.to_dataframe("junctions")
-
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 2
-        assert "name" in df.columns
-        assert df["name"].tolist() == ["J1", "J2"]
-
-
-def test_input_to_dataframe_all_sections():
-    """Test exporting all sections to DataFrame dictionary."""
-    pd = pytest.importorskip("pandas")
+@pytest.fixture(scope="module")
+def dataframe_inp():
+    """One populated SwmmInput shared by the read-only DataFrame tests."""
+    pytest.importorskip("pandas")
 
     with SwmmInput() as inp:
+        inp.title = "Test Model"
+        inp.options = {"FLOW_UNITS": "CFS"}
+        inp.evaporation = {"type": "CONSTANT", "values": ["0.1"]}
+        inp.transects = "NC 0.020 0.020 0.020\n"
         inp.junctions = [
-            {"name": "J1", "elevation": 100},
-            {"name": "J2", "elevation": 95},
+            {"name": "J1", "elevation": 100, "max_depth": 5.5, "init_depth": 0},
+            {"name": "J2", "elevation": 95},  # missing max_depth and init_depth
         ]
-        inp.outfalls = [
-            {"name": "O1", "elevation": 80},
-        ]
-        inp.title = "Test Model"
-
-        dfs = inp.to_dataframe()
-
-        assert isinstance(dfs, dict)
-        assert "junctions" in dfs
-        assert "outfalls" in dfs
-        assert "title" not in dfs  # String sections excluded
-        assert len(dfs["junctions"]) == 2
-        assert len(dfs["outfalls"]) == 1
-
-
-def test_input_to_dataframe_empty():
-    """Test exporting empty section returns empty DataFrame."""
-    pd = pytest.importorskip("pandas")
-
-    with SwmmInput() as inp:
-        inp.junctions = []
-
-        df = inp.to_dataframe("junctions")
-
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 0
-
-
-def test_input_to_dataframe_invalid_section():
-    """Test error when requesting invalid section."""
-    with SwmmInput() as inp:
-        with pytest.raises(ValueError, match="not found"):
-            inp.to_dataframe("nonexistent_section")
-
-
-def test_input_to_dataframe_complex_data():
-    """Test DataFrame export with complex nested data."""
-    pd = pytest.importorskip("pandas")
-
-    with SwmmInput() as inp:
+        inp.outfalls = []  # empty list
         inp.conduits = [
             {
                 "name": "C1",
-                "inlet_node": "J1",
-                "outlet_node": "J2",
+                "from_node": "J1",
+                "to_node": "J2",
                 "length": 1000,
                 "roughness": 0.01,
             },
             {
                 "name": "C2",
-                "inlet_node": "J2",
-                "outlet_node": "O1",
+                "from_node": "J2",
+                "to_node": "O1",
                 "length": 500,
                 "roughness": 0.012,
             },
         ]
+        yield inp
+
 
-        df = inp.to_dataframe("conduits")
+def test_input_to_dataframe_single_section(dataframe_inp):
+    """Test exporting a single section to DataFrame."""
+    import pandas as pd
 
-        assert isinstance(df, pd.DataFrame)
-        assert len(df) == 2
-        assert df.loc[df["name"] == "C1", "length"].values[0] == 1000
-        assert df.loc[df["name"] == "C2", "roughness"].values[0] == 0.012
+    df = dataframe_inp.to_dataframe("junctions")
 
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 2
+    assert np.array_equal(df["name"].to_numpy(), np.asarray(["J1", "J2"]))
 
-def test_input_to_dataframe_non_list_section_raises():
-    """Test that requesting a non-list section (e.g. options dict) raises ValueError."""
-    with SwmmInput() as inp:
-        inp.options = {"FLOW_UNITS": "CFS"}
 
-        with pytest.raises(ValueError):
-            inp.to_dataframe("options")
+def test_input_to_dataframe_empty(dataframe_inp):
+    """Test exporting empty section returns empty DataFrame."""
+    import pandas as pd
 
+    df = dataframe_inp.to_dataframe("outfalls")
 
-def test_input_to_dataframe_all_sections_excludes_non_list():
-    """Test that all-sections export excludes dict and string sections."""
-    pd = pytest.importorskip("pandas")
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 0
+
+
+def test_input_to_dataframe_empty_results_are_independent():
+    """Test that modifying one empty DataFrame does not leak into the next."""
+    pytest.importorskip("pandas")
 
     with SwmmInput() as inp:
-        inp.title = "Test"
-        inp.options = {"FLOW_UNITS": "CFS"}
-        inp.evaporation = {"type": "CONSTANT", "values": ["0.1"]}
-        inp.transects = "NC 0.020 0.020 0.020\n"
-        inp.junctions = [{"name": "J1", "elevation": 100}]
+        inp.junctions = []
 
-        dfs = inp.to_dataframe()
+        first = inp.to_dataframe("junctions")
+        first["name"] = []
 
-        assert "title" not in dfs
-        assert "options" not in dfs
-        assert "evaporation" not in dfs
-        assert "transects" not in dfs
-        assert "junctions" in dfs
+        assert len(inp.to_dataframe("junctions").columns) == 0
+        assert len(inp.to_dataframe()["junctions"].columns) == 0
 
 
-def test_input_to_dataframe_all_sections_includes_empty_lists():
-    """Test that all-sections export includes sections with empty lists as empty DataFrames."""
-    pd = pytest.importorskip("pandas")
+@pytest.mark.parametrize(
+    "section, match",
+    [
+        ("nonexistent_section", "not found"),
+        ("options", None),  # dict section
+        ("title", None),  # string section
+    ],
+)
+def test_input_to_dataframe_invalid_section_raises(dataframe_inp, section, match):
+    """Test that missing and non-list sections raise ValueError."""
+    with pytest.raises(ValueError, match=match):
+        dataframe_inp.to_dataframe(section)
 
-    with SwmmInput() as inp:
-        inp.junctions = [{"name": "J1"}]
-        inp.outfalls = []  # empty list
 
-        dfs = inp.to_dataframe()
+@pytest.mark.parametrize(
+    "section, name, column, expected",
+    [
+        ("junctions", "J1", "elevation", 100),
+        ("junctions", "J2", "elevation", 95),
+        ("conduits", "C1", "length", 1000),
+        ("conduits", "C2", "roughness", 0.012),
+        ("conduits", "C1", "from_node", "J1"),
+    ],
+)
+def test_input_to_dataframe_cell_values(dataframe_inp, section, name, column, expected):
+    """Test individual cells of exported DataFrames."""
+    df = dataframe_inp.to_dataframe(section)
 
-        assert "junctions" in dfs
-        assert "outfalls" in dfs
-        assert isinstance(dfs["outfalls"], pd.DataFrame)
-        assert len(dfs["outfalls"]) == 0
+    assert df.loc[df["name"] == name, column].iat[0] == expected
 
 
-def test_input_to_dataframe_only_non_list_sections_returns_empty_dict():
-    """Test that all-sections export returns empty dict when no list sections exist."""
-    with SwmmInput() as inp:
-        inp.title = "No Lists"
-        inp.options = {"FLOW_UNITS": "CFS"}
+def test_input_to_dataframe_column_names_match_dict_keys(dataframe_inp):
+    """Test that DataFrame columns are the union of the source dict keys."""
+    df = dataframe_inp.to_dataframe("junctions")
 
-        dfs = inp.to_dataframe()
+    assert set(df.columns) == {"name", "elevation", "max_depth", "init_depth"}
 
-        assert isinstance(dfs, dict)
-        assert len(dfs) == 0
 
+def test_input_to_dataframe_numeric_dtypes_preserved(dataframe_inp):
+    """Test that numeric values retain their types in the DataFrame."""
+    import pandas as pd
 
-def test_input_to_dataframe_column_names_match_dict_keys():
-    """Test that DataFrame columns match the keys of the source dicts."""
-    pd = pytest.importorskip("pandas")
+    df = dataframe_inp.to_dataframe("junctions")
 
-    with SwmmInput() as inp:
-        inp.junctions = [
-            {"name": "J1", "elevation": 100, "max_depth": 5, "init_depth": 0},
-        ]
+    assert pd.api.types.is_integer_dtype(df["elevation"])
+    assert pd.api.types.is_float_dtype(df["max_depth"])
 
-        df = inp.to_dataframe("junctions")
 
-        assert set(df.columns) == {"name", "elevation", "max_depth", "init_depth"}
+def test_input_to_dataframe_inconsistent_keys_yields_nan(dataframe_inp):
+    """Test that rows with missing keys produce NaN for those columns."""
+    import pandas as pd
 
+    df = dataframe_inp.to_dataframe("junctions")
 
-def test_input_to_dataframe_numeric_dtypes_preserved():
-    """Test that numeric values retain their types in the DataFrame."""
-    pd = pytest.importorskip("pandas")
+    assert pd.isna(df.loc[df["name"] == "J2", "max_depth"].iat[0])
 
-    with SwmmInput() as inp:
-        inp.junctions = [
-            {"name": "J1", "elevation": 100, "max_depth": 5.5},
-        ]
 
-        df = inp.to_dataframe("junctions")
+@pytest.mark.parametrize(
+    "section, included",
+    [
+        ("junctions", True),
+        ("conduits", True),
+        ("outfalls", True),  # empty lists become empty DataFrames
+        ("title", False),
+        ("options", False),
+        ("evaporation", False),
+        ("transects", False),
+    ],
+)
+def test_input_to_dataframe_all_sections(dataframe_inp, section, included):
+    """Test that all-sections export holds list sections only."""
+    import pandas as pd
 
-        assert df["elevation"].dtype == int or pd.api.types.is_integer_dtype(
-            df["elevation"]
-        )
-        assert df["max_depth"].dtype == float or pd.api.types.is_float_dtype(
-            df["max_depth"]
-        )
+    dfs = dataframe_inp.to_dataframe()
 
+    assert isinstance(dfs, dict)
+    assert (section in dfs) == included
+    if included:
+        assert isinstance(dfs[section], pd.DataFrame)
+        assert len(dfs[section]) == len(getattr(dataframe_inp, section))
 
-def test_input_to_dataframe_inconsistent_keys_yields_nan():
-    """Test that rows with missing keys produce NaN for those columns."""
-    pd = pytest.importorskip("pandas")
 
+def test_input_to_dataframe_all_sections_subdataframe_accessible(dataframe_inp):
+    """Test that DataFrames in the all-sections dict are fully functional."""
+    jdf = dataframe_inp.to_dataframe()["junctions"]
+
+    assert jdf["elevation"].max() == 100
+    assert np.array_equal(jdf["name"].to_numpy(), np.asarray(["J1", "J2"]))
+
+
+def test_input_to_dataframe_only_non_list_sections_returns_empty_dict():
+    """Test that all-sections export returns empty dict when no list sections exist."""
     with SwmmInput() as inp:
-        inp.junctions = [
-            {"name": "J1", "elevation": 100, "max_depth": 5},
-            {"name": "J2", "elevation": 90},  # missing max_depth
-        ]
+        inp.title = "No Lists"
+        inp.options = {"FLOW_UNITS": "CFS"}
 
-        df = inp.to_dataframe("junctions")
+        dfs = inp.to_dataframe()
 
-        assert len(df) == 2
-        assert "max_depth" in df.columns
-        assert pd.isna(df.loc[df["name"] == "J2", "max_depth"].values[0])
+        assert isinstance(dfs, dict)
+        assert len(dfs) == 0
 
 
-def test_input_to_dataframe_all_sections_subdataframe_accessible():
-    """Test that DataFrames in the all-sections dict are fully functional."""
+def test_input_to_dataframe_rows_with_different_keys():
+    """Test that rows missing or adding keys still produce every column."""
     pd = pytest.importorskip("pandas")
 
     with SwmmInput() as inp:
         inp.junctions = [
             {"name": "J1", "elevation": 100},
-            {"name": "J2", "elevation": 95},
-        ]
-        inp.conduits = [
-            {"name": "C1", "from_node": "J1", "to_node": "J2"},
+            {"name": "J2", "max_depth": 6},
+            {"elevation": 90, "name": "J3"},
         ]
 
-        dfs = inp.to_dataframe()
-
-        jdf = dfs["junctions"]
-        assert isinstance(jdf, pd.DataFrame)
-        assert "name" in jdf.columns
-        assert "elevation" in jdf.columns
-        assert jdf["elevation"].max() == 100
+        df = inp.to_dataframe("junctions")
 
-        cdf = dfs["conduits"]
-        assert cdf.loc[cdf["name"] == "C1", "from_node"].values[0] == "J1"
+        assert list(df.columns) == ["name", "elevation", "max_depth"]
+        assert np.array_equal(df["name"].to_numpy(), np.asarray(["J1", "J2", "J3"]))
+        assert pd.isna(df.loc[1, "elevation"])
+        assert df.loc[2, "elevation"] == 90
@@ -3,6 +3,7 @@
 Tests the SwmmInputEncoder class for generating .inp files.
 """
 
+import numpy as np
 import pytest
 import sys
 from pathlib import Path
@@ -306,7 +307,7 @@ def test_encoder_to_dataframe_single_section():
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 2
     assert list(df.columns) == ["name", "elevation", "max_depth"]
-    assert df["name"].tolist() == ["J1", "J2"]
+    assert np.array_equal(df["name"].to_numpy(), np.asarray(["J1", "J2"]))
 
 
 def test_encoder_to_dataframe_all_sections():
@@ -3,9 +3,13 @@
 Tests the SwmmOutputDecoder class for parsing .out binary files.
 """
 
-import pytest
+import struct
+import tracemalloc
+from datetime import datetime, timedelta
 from pathlib import Path
-from datetime import datetime
+
+import numpy as np
+import pytest
 
 from swmm_utils import SwmmOutputDecoder
 
@@ -13,15 +17,11 @@ from swmm_utils import SwmmOutputDecoder
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 EXAMPLE1_OUT = EXAMPLES_DIR / "example1" / "example1.out"
 
-
-@pytest.fixture
-def example_data():
-    """Load example output data for testing decoder."""
-    if not EXAMPLE1_OUT.exists():
-        pytest.skip("example1.out not found")
-
-    decoder = SwmmOutputDecoder()
-    return decoder.decode_file(EXAMPLE1_OUT)
+_FLOW_UNITS = frozenset({"CFS", "GPM", "MGD", "CMS", "LPS", "MLD"})
+_LABEL_GROUPS = frozenset({"subcatchment", "node", "link", "pollutant"})
+_METADATA_KEYS = frozenset(
+    {"labels", "properties", "start_date", "report_interval", "n_periods"}
+)
 
 
 def test_decoder_initialization():
@@ -30,77 +30,149 @@ def test_decoder_initialization():
     assert decoder is not None
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_decoder_file_parsing(example_data):
-    """Test decoding example1.out file returns expected structure."""
-    assert "header" in example_data
-    assert "metadata" in example_data
-    assert "time_index" in example_data
-
-
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_decoder_header_structure(example_data):
-    """Test header information is correctly parsed."""
-    header = example_data["header"]
-
-    # Verify magic number
+def _check_header(data):
+    header = data["header"]
     assert header["magic_start"] == 516114522
-
-    # Verify version info
     assert header["version"] > 0
-    assert "version_str" in header
     assert "." in header["version_str"]
-
-    # Verify flow unit
-    assert header["flow_unit"] in ["CFS", "GPM", "MGD", "CMS", "LPS", "MLD"]
-
-    # Verify element counts
+    assert header["flow_unit"] in _FLOW_UNITS
     assert header["n_subcatchments"] >= 0
     assert header["n_nodes"] >= 0
     assert header["n_links"] >= 0
     assert header["n_pollutants"] >= 0
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_decoder_metadata_structure(example_data):
-    """Test metadata is correctly parsed."""
-    metadata = example_data["metadata"]
+def _check_metadata(data):
+    metadata = data["metadata"]
+    assert _METADATA_KEYS <= metadata.keys()
+    assert _LABEL_GROUPS <= metadata["labels"].keys()
+    assert all(isinstance(group, list) for group in metadata["labels"].values())
+
 
-    # Check required sections
-    assert "labels" in metadata
-    assert "properties" in metadata
-    assert "start_date" in metadata
-    assert "report_interval" in metadata
-    assert "n_periods" in metadata
+def _check_time_index(data):
+    time_index = data["time_index"]
+    assert time_index.dtype == np.dtype("datetime64[s]")
+    assert len(time_index) == data["metadata"]["n_periods"]
 
-    # Check labels structure
-    labels = metadata["labels"]
-    assert "subcatchment" in labels
-    assert "node" in labels
-    assert "link" in labels
-    assert "pollutant" in labels
 
-    # Check all labels are lists
-    assert isinstance(labels["subcatchment"], list)
-    assert isinstance(labels["node"], list)
-    assert isinstance(labels["link"], list)
-    assert isinstance(labels["pollutant"], list)
+@pytest.mark.parametrize(
+    "check",
+    [
+        pytest.param(_check_header, id="header"),
+        pytest.param(_check_metadata, id="metadata"),
+        pytest.param(_check_time_index, id="time_index"),
+    ],
+)
+def test_decoder_section(example_data, check):
+    """Test each top-level section of the decoded example1.out."""
+    check(example_data)
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
 def test_decoder_time_index_creation(example_data):
-    """Test time index is properly created."""
-    time_index = example_data["time_index"]
-
-    assert isinstance(time_index, list)
-    assert len(time_index) == example_data["metadata"]["n_periods"]
-
-    # If multiple periods, check they're ordered
-    if len(time_index) > 1:
-        assert time_index[0] < time_index[-1]
-        # Check all are datetime objects
-        for ts in time_index:
-            assert isinstance(ts, datetime)
+    """Test time index timestamps are strictly increasing."""
+    ti = example_data["time_index"]
+
+    if ti.size > 1:
+        assert np.all(np.diff(ti.view("i8")) > 0)
+
+
+@pytest.mark.parametrize(
+    "excel_date, expected",
+    [
+        # 1998-01-01 00:00:00.008640
+        (35796.0000001, datetime(1998, 1, 1)),
+        # 2007-01-01 05:59:59.999136
+        (39083.24999999, datetime(2007, 1, 1, 6)),
+    ],
+    ids=["just-after", "just-before"],
+)
+def test_decoder_excel_date_rounds_to_second(decoder, excel_date, expected):
+    """Test Excel serial dates are rounded to the nearest second."""
+    assert decoder._excel_date_to_datetime(excel_date) == expected
+
+
+def test_decoder_create_time_index(decoder):
+    """Test time index is a datetime64[s] array of report times."""
+    start = datetime(2007, 1, 1, 6)
+
+    time_index = decoder._create_time_index(start, timedelta(minutes=5), 3)
+
+    assert time_index.dtype == np.dtype("datetime64[s]")
+    assert np.datetime_as_string(time_index, unit="s").tolist() == [
+        "2007-01-01T06:00:00",
+        "2007-01-01T06:05:00",
+        "2007-01-01T06:10:00",
+    ]
+
+
+@pytest.mark.parametrize(
+    "wrap",
+    [bytes, bytearray, lambda raw: memoryview(bytearray(raw))],
+    ids=["bytes", "bytearray", "memoryview"],
+)
+def test_decoder_decode_buffer_matches_file(decoder, example_data, wrap):
+    """Test decoding an in-memory buffer gives the same result as the file."""
+    data = decoder.decode_buffer(wrap(EXAMPLE1_OUT.read_bytes()))
+
+    assert data["filepath"] is None
+    assert data["header"] == example_data["header"]
+    assert data["metadata"] == example_data["metadata"]
+    assert np.array_equal(data["time_index"], example_data["time_index"])
+
+
+def _peak_allocation(func) -> int:
+    """Peak bytes allocated while running func, as seen by tracemalloc."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_decoder_decode_buffer_reads_in_place(decoder, example_data):
+    """Test decode_buffer parses the buffer without copying it.
+
+    The baseline decodes bytes(view), which copies the whole file inside the
+    traced call. Reading in place must peak at least half a file below it,
+    whatever the file's size relative to the decoded metadata.
+    """
+    view = memoryview(bytearray(EXAMPLE1_OUT.read_bytes()))
+    # Warm up so one-time allocations land in neither measurement
+    assert decoder.decode_buffer(view)["header"] == example_data["header"]
+
+    copy_peak = _peak_allocation(lambda: decoder.decode_buffer(bytes(view)))
+    in_place_peak = _peak_allocation(lambda: decoder.decode_buffer(view))
+
+    assert in_place_peak < copy_peak - view.nbytes // 2
+
+
+def test_decoder_rejects_empty_file(decoder, tmp_path):
+    """Test an empty file is reported as an invalid .out file."""
+    empty = tmp_path / "empty.out"
+    empty.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="Invalid .out file"):
+        decoder.decode_file(empty)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"[TITLE]\nnot a binary output file\n",
+        # Valid opening header, then cut off before labels and footer
+        struct.pack("<7i", 516114522, 51500, 0, 2, 3, 2, 0),
+    ],
+    ids=["text", "truncated"],
+)
+@pytest.mark.parametrize("include_time_series", [False, True])
+def test_decoder_rejects_invalid_file(decoder, tmp_path, content, include_time_series):
+    """Test non-.out and truncated files raise ValueError, not BufferError."""
+    bad = tmp_path / "bad.out"
+    bad.write_bytes(content)
+
+    with pytest.raises(ValueError, match="Invalid .out file"):
+        decoder.decode_file(bad, include_time_series=include_time_series)
 
 
 if __name__ == "__main__":
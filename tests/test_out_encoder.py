@@ -3,35 +3,180 @@
 Tests the SwmmOutputEncoder class for generating .out files in other formats.
 """
 
-import pytest
-from pathlib import Path
 import json
+import sys
+import pytest
+from datetime import datetime
+
+from swmm_utils import SwmmOutputEncoder
 
-from swmm_utils import SwmmOutputDecoder, SwmmOutputEncoder
 
-# Get the examples directory
-EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
-EXAMPLE1_OUT = EXAMPLES_DIR / "example1" / "example1.out"
+def test_encoder_initialization():
+    """Test encoder can be initialized."""
+    encoder = SwmmOutputEncoder()
+    assert encoder is not None
 
 
 @pytest.fixture
-def example_data():
-    """Load example output data for testing encoder."""
-    if not EXAMPLE1_OUT.exists():
-        pytest.skip("example1.out not found")
+def synthetic_data():
+    """Minimal decoded output structure that needs no example file."""
+    return {
+        "header": {"version": 52000, "flow_unit": "CFS"},
+        "metadata": {
+            "labels": {"node": ["J1", "Ø2"], "link": ["C1"], "subcatchment": []},
+            "pollutant_units": {},
+            "properties": {
+                "node": {
+                    "J1": {"type": "JUNCTION", "invert": 1.5},
+                    "Ø2": {"type": "OUTFALL", "invert": 0.5},
+                },
+                "link": {"C1": {"type": "CONDUIT", "length": 400.0}},
+                "subcatchment": {},
+            },
+            "variables": {"node": 1},
+            "start_date": datetime(2020, 1, 1, 6, 30),
+            "report_interval_seconds": 300,
+            "n_periods": 1,
+        },
+        "time_series": {"nodes": {"J1": [{"timestamp": "2020-01-01T06:35:00"}]}},
+    }
+
+
+def test_encoder_to_json_synthetic_data(synthetic_data, tmp_path, read_json):
+    """Test JSON export of a minimal decoded structure, compact and pretty."""
+    encoder = SwmmOutputEncoder()
 
-    decoder = SwmmOutputDecoder()
-    return decoder.decode_file(EXAMPLE1_OUT)
+    for pretty in (True, False):
+        json_file = tmp_path / f"output_{pretty}.json"
+        encoder.encode_to_json(synthetic_data, json_file, pretty=pretty)
 
+        exported = read_json(json_file)
+        assert exported["metadata"]["start_date"] == "2020-01-01T06:30:00"
+        assert exported["metadata"]["labels"]["node"] == ["J1", "Ø2"]
+        assert exported["time_series"] == synthetic_data["time_series"]
+
+
+def _reject_constant(name):
+    raise ValueError(f"non-standard JSON constant {name}")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_encoder_to_json_non_finite_as_null(
+    synthetic_data, tmp_path, monkeypatch, backend
+):
+    """Test NaN and infinity are written as null with or without orjson."""
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    synthetic_data["time_series"]["nodes"]["J1"][0].update(
+        {"depth": float("nan"), "inflow": float("inf"), "head": 1.5}
+    )
+
+    json_file = tmp_path / "output.json"
+    SwmmOutputEncoder().encode_to_json(synthetic_data, json_file)
+
+    exported = json.loads(
+        json_file.read_text(encoding="utf-8"), parse_constant=_reject_constant
+    )
+    assert exported["time_series"]["nodes"]["J1"] == [
+        {
+            "timestamp": "2020-01-01T06:35:00",
+            "depth": None,
+            "inflow": None,
+            "head": 1.5,
+        }
+    ]
+
+
+def test_encoder_to_parquet_synthetic_data(synthetic_data, parquet_dir):
+    """Test multi-file Parquet export reads back one row per element."""
+    pd = pytest.importorskip("pandas")
 
-def test_encoder_initialization():
-    """Test encoder can be initialized."""
     encoder = SwmmOutputEncoder()
-    assert encoder is not None
+    output_dir = parquet_dir / "synthetic_multi"
+
+    encoder.encode_to_parquet(
+        synthetic_data,
+        output_dir,
+        single_file=False,
+        summary_func=lambda: {"version": "5.2", "nodes": ["J1", "Ø2"]},
+    )
+
+    nodes = pd.read_parquet(output_dir / "nodes.parquet")
+    assert list(nodes.columns) == ["id", "type", "invert"]
+    assert nodes["id"].tolist() == ["J1", "Ø2"]
+    assert nodes["invert"].tolist() == [1.5, 0.5]
+    assert pd.read_parquet(output_dir / "links.parquet")["length"].tolist() == [400.0]
+    assert not (output_dir / "subcatchments.parquet").exists()
+
+    summary = pd.read_parquet(output_dir / "summary.parquet")
+    assert summary["value"].tolist() == ["5.2", "J1, Ø2"]
+
+    # Float properties are byte-stream-split, labels dictionary encoded
+    pq = pytest.importorskip("pyarrow.parquet")
+    row_group = pq.read_metadata(output_dir / "nodes.parquet").row_group(0)
+    encodings = {
+        row_group.column(i).path_in_schema: row_group.column(i).encodings
+        for i in range(row_group.num_columns)
+    }
+    assert "BYTE_STREAM_SPLIT" in encodings["invert"]
+    assert "RLE_DICTIONARY" in encodings["id"]
+    assert row_group.column(0).compression == "ZSTD"
+
+
+def test_encoder_to_parquet_chunked_row_groups(synthetic_data, parquet_dir):
+    """Test tables longer than chunk_size are written as several row groups."""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    encoder = SwmmOutputEncoder()
+    output_dir = parquet_dir / "synthetic_chunked"
+
+    encoder.encode_to_parquet(
+        synthetic_data, output_dir, single_file=False, chunk_size=1
+    )
+
+    nodes_file = output_dir / "nodes.parquet"
+    assert pq.read_metadata(nodes_file).num_row_groups == 2
+    assert pq.read_table(nodes_file).column("id").to_pylist() == ["J1", "Ø2"]
+    assert pq.read_metadata(output_dir / "links.parquet").num_row_groups == 1
 
+    with pytest.raises(ValueError, match="chunk_size"):
+        encoder.encode_to_parquet(synthetic_data, output_dir, chunk_size=0)
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_to_json_with_summary(example_data, tmp_path):
+
+def test_encoder_to_parquet_chunked_null_first_chunk(synthetic_data, parquet_dir):
+    """Test a column that is all None in the first row group keeps its type."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    synthetic_data["metadata"]["properties"]["node"]["J1"]["invert"] = None
+
+    output_dir = parquet_dir / "synthetic_null_chunk"
+    SwmmOutputEncoder().encode_to_parquet(
+        synthetic_data, output_dir, single_file=False, chunk_size=1
+    )
+
+    table = pq.read_table(output_dir / "nodes.parquet")
+    assert table.schema.field("invert").type == pa.float64()
+    assert table.column("invert").to_pylist() == [None, 0.5]
+
+
+@pytest.fixture(scope="module")
+def encoded_json(tmp_path_factory, example_data):
+    """example_data encoded once as pretty and compact JSON, without summary.
+
+    Tests that only inspect these outputs share them instead of re-encoding.
+    """
+    out_dir = tmp_path_factory.mktemp("encoded_json")
+    paths = {"pretty": out_dir / "pretty.json", "compact": out_dir / "compact.json"}
+
+    encoder = SwmmOutputEncoder()
+    encoder.encode_to_json(example_data, paths["pretty"], pretty=True)
+    encoder.encode_to_json(example_data, paths["compact"], pretty=False)
+    return paths
+
+
+def test_encoder_to_json_with_summary(example_data, tmp_path, read_json):
     """Test encoding to JSON format with summary function."""
     encoder = SwmmOutputEncoder()
     json_file = tmp_path / "output.json"
@@ -51,126 +196,95 @@ def test_encoder_to_json_with_summary(example_data, tmp_path):
     assert json_file.stat().st_size > 0
 
     # Verify JSON structure
-    with open(json_file, "r") as f:
-        data = json.load(f)
-        assert "header" in data
-        assert "metadata" in data
-        assert "summary" in data
-        assert data["summary"]["version"] == "5.2"
+    data = read_json(json_file)
+    assert "header" in data
+    assert "metadata" in data
+    assert data["summary"]["version"] == "5.2"
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_to_json_without_summary(example_data, tmp_path):
+def test_encoder_to_json_without_summary(encoded_json, read_json):
     """Test encoding to JSON format without summary function."""
-    encoder = SwmmOutputEncoder()
-    json_file = tmp_path / "output_no_summary.json"
+    data = read_json(encoded_json["pretty"])
+    assert "header" in data
+    assert "metadata" in data
+    assert "summary" not in data
 
-    encoder.encode_to_json(example_data, json_file, pretty=True)
-
-    assert json_file.exists()
 
-    # Verify JSON doesn't include summary
-    with open(json_file, "r") as f:
-        data = json.load(f)
-        assert "header" in data
-        assert "metadata" in data
-        assert "summary" not in data
-
-
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_json_pretty_formatting(example_data, tmp_path):
+def test_encoder_json_pretty_formatting(encoded_json, read_json):
     """Test JSON pretty printing vs compact formatting."""
-    encoder = SwmmOutputEncoder()
-
-    json_pretty = tmp_path / "pretty.json"
-    json_compact = tmp_path / "compact.json"
-
-    encoder.encode_to_json(example_data, json_pretty, pretty=True)
-    encoder.encode_to_json(example_data, json_compact, pretty=False)
-
     # Compact should be smaller or equal in size
-    assert json_compact.stat().st_size <= json_pretty.stat().st_size
-
-
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_to_parquet_single_file(example_data, tmp_path):
-    """Test encoding to Parquet single file format."""
-    pytest.importorskip("pandas")
-    pytest.importorskip("pyarrow")
-
-    encoder = SwmmOutputEncoder()
-    parquet_file = tmp_path / "output.parquet"
-
-    def summary_func():
-        return {"version": "5.2"}
-
-    encoder.encode_to_parquet(
-        example_data, parquet_file, single_file=True, summary_func=summary_func
+    assert (
+        encoded_json["compact"].stat().st_size <= encoded_json["pretty"].stat().st_size
     )
+    assert read_json(encoded_json["compact"]) == read_json(encoded_json["pretty"])
 
-    assert parquet_file.exists()
-    assert parquet_file.stat().st_size > 0
 
-
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_to_parquet_multiple_files(example_data, tmp_path):
-    """Test encoding to Parquet multi-file format."""
+@pytest.mark.parametrize("single_file", [True, False])
+def test_encoder_to_parquet(example_data, parquet_dir, single_file):
+    """Test encoding to Parquet single-file and multi-file formats."""
     pytest.importorskip("pandas")
     pytest.importorskip("pyarrow")
 
     encoder = SwmmOutputEncoder()
-    parquet_dir = tmp_path / "output_parquet"
+    output_path = parquet_dir / (
+        "encoder_single.parquet" if single_file else "encoder_multi"
+    )
 
     def summary_func():
         return {"version": "5.2"}
 
     encoder.encode_to_parquet(
-        example_data, parquet_dir, single_file=False, summary_func=summary_func
+        example_data, output_path, single_file=single_file, summary_func=summary_func
     )
 
+    if single_file:
+        assert output_path.exists()
+        assert output_path.stat().st_size > 0
+        return
+
     # Check directory and summary file exist
-    assert parquet_dir.exists()
-    assert (parquet_dir / "summary.parquet").exists()
+    assert output_path.exists()
+    assert (output_path / "summary.parquet").exists()
 
     # Check element files exist based on data
     if example_data["metadata"]["labels"]["node"]:
-        assert (parquet_dir / "nodes.parquet").exists()
+        assert (output_path / "nodes.parquet").exists()
     if example_data["metadata"]["labels"]["link"]:
-        assert (parquet_dir / "links.parquet").exists()
+        assert (output_path / "links.parquet").exists()
     if example_data["metadata"]["labels"]["subcatchment"]:
-        assert (parquet_dir / "subcatchments.parquet").exists()
+        assert (output_path / "subcatchments.parquet").exists()
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_format_auto_detection_json(example_data, tmp_path):
+def test_encoder_format_auto_detection_json(
+    example_data, encoded_json, tmp_path, read_json
+):
     """Test encode_to_file auto-detects JSON format from extension."""
     encoder = SwmmOutputEncoder()
     json_file = tmp_path / "output.json"
 
     encoder.encode_to_file(example_data, json_file)
 
-    assert json_file.exists()
-    with open(json_file, "r") as f:
-        data = json.load(f)
-        assert "header" in data
+    # Same output as an explicit pretty encode_to_json call
+    assert json_file.read_bytes() == encoded_json["pretty"].read_bytes()
+    assert "header" in read_json(json_file)
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_format_auto_detection_parquet(example_data, tmp_path):
+def test_encoder_format_auto_detection_parquet(example_data, parquet_dir):
     """Test encode_to_file auto-detects Parquet format from extension."""
     pytest.importorskip("pandas")
     pytest.importorskip("pyarrow")
 
     encoder = SwmmOutputEncoder()
-    parquet_file = tmp_path / "output.parquet"
+    parquet_file = parquet_dir / "encoder_auto_detected.parquet"
 
     encoder.encode_to_file(example_data, parquet_file)
 
     assert parquet_file.exists()
 
 
-@pytest.mark.skipif(not EXAMPLE1_OUT.exists(), reason="example1.out not found")
-def test_encoder_explicit_format_specification(example_data, tmp_path):
+def test_encoder_explicit_format_specification(
+    example_data, encoded_json, tmp_path, read_json
+):
     """Test encode_to_file with explicit format specification."""
     encoder = SwmmOutputEncoder()
     output_file = tmp_path / "output.dat"
@@ -178,10 +292,8 @@ def test_encoder_explicit_format_specification(example_data, tmp_path):
     # Explicitly specify JSON format despite .dat extension
     encoder.encode_to_file(example_data, output_file, file_format="json")
 
-    assert output_file.exists()
-    with open(output_file, "r") as f:
-        data = json.load(f)
-        assert "header" in data
+    assert output_file.read_bytes() == encoded_json["pretty"].read_bytes()
+    assert "header" in read_json(output_file)
 
 
 if __name__ == "__main__":
@@ -81,3 +81,39 @@ def test_swmm_report_repr():
     repr_str = repr(report)
     assert "SwmmReport" in repr_str
     assert "5.2" in repr_str
+
+
+NODE_DEPTH_REPORT = """
+  ******************
+  Node Depth Summary
+  ******************
+
+  ---------------------------------------------------------------------------------
+                                 Average  Maximum  Maximum  Time of Max    Reported
+                                   Depth    Depth      HGL   Occurrence   Max Depth
+  Node                 Type         Feet     Feet     Feet  days hr:min        Feet
+  ---------------------------------------------------------------------------------
+  {name}                   JUNCTION     0.25     1.52    97.52     0  03:00        1.52
+
+
+  *******************
+  Node Inflow Summary
+  *******************
+"""
+
+
+def test_swmm_report_lookup_after_reload(tmp_path):
+    """Test name lookups reflect the most recently loaded report."""
+    first = tmp_path / "first.rpt"
+    first.write_text(NODE_DEPTH_REPORT.format(name="J1"))
+    second = tmp_path / "second.rpt"
+    second.write_text(NODE_DEPTH_REPORT.format(name="J2"))
+
+    report = SwmmReport(first)
+    assert report.get_node_by_name("J1")["type"] == "JUNCTION"
+    assert report.get_node_by_name("J2") is None
+    assert report.get_link_by_name("J1") is None
+
+    report.load(second)
+    assert report.get_node_by_name("J1") is None
+    assert report.get_node_by_name("J2")["maximum_depth"] == 1.52
@@ -1,5 +1,7 @@
 """Tests for SWMM report file decoder."""
 
+import io
+
 import pytest
 from pathlib import Path
 from swmm_utils import SwmmReportDecoder
@@ -113,3 +115,179 @@ def test_swmm_report_link_flow():
     assert p001["name"] == "P001"
     assert p001["type"] == "CONDUIT"
     assert p001["maximum_flow"] == pytest.approx(23.73, rel=0.01)
+
+
+PUMPING_REPORT = """
+  ***************
+  Pumping Summary
+  ***************
+
+  ---------------------------------------------------------------------------------------------------------
+                                                  Min       Avg       Max     Total     Power    % Time Off
+                 Percent   Number of    Flow      Flow      Flow    Volume     Usage    Pump Curve
+  Pump          Utilized   Start-Ups     CFS       CFS       CFS  10^6 gal     Kw-hr    Low   High
+  ---------------------------------------------------------------------------------------------------------
+  PMP1             45.23           3    0.00      4.50     10.00     0.300     12.50    0.0    1.5
+  Max_Pump         10.00           1    0.00      1.00      2.00     0.010      1.00    0.0    0.0
+
+"""
+
+
+def test_swmm_report_pumping_summary(tmp_path):
+    """Test that pumping rows are read from below the header rule."""
+    rpt_file = tmp_path / "pumps.rpt"
+    rpt_file.write_text(PUMPING_REPORT)
+
+    data = SwmmReportDecoder().decode_file(rpt_file)
+
+    pumps = data["pumping_summary"]
+    assert [p["pump_name"] for p in pumps] == ["PMP1", "Max_Pump"]
+    assert pumps[0]["num_startups"] == 3
+    assert pumps[0]["max_flow"] == pytest.approx(10.0)
+
+
+LINK_FLOW_REPORT = """
+  *****************
+  Link Flow Summary
+  *****************
+
+  -----------------------------------------------------------------------------
+                                 Maximum  Time of Max   Maximum    Max/    Max/
+                                  |Flow|   Occurrence   |Veloc|    Full    Full
+  Link                 Type          CFS  days hr:min    ft/sec    Flow   Depth
+  -----------------------------------------------------------------------------
+  P001                 CONDUIT     23.73     0  03:00      5.11    0.52    0.55
+  P002                 CONDUIT    >50.00     1  12:30      ****    1.00    1.00
+  PMP1                 PUMP        10.00     0  03:05               0.80
+
+  *************************
+"""
+
+
+def test_swmm_report_link_flow_special_values(tmp_path):
+    """Test that capped and overflowed link flow values are decoded."""
+    rpt_file = tmp_path / "links.rpt"
+    rpt_file.write_text(LINK_FLOW_REPORT)
+
+    links = SwmmReportDecoder().decode_file(rpt_file)["link_flow"]
+
+    assert [link["name"] for link in links] == ["P001", "P002"]
+    assert links[0]["maximum_velocity"] == pytest.approx(5.11)
+    assert links[1]["maximum_flow"] == pytest.approx(50.0)
+    assert links[1]["time_of_max_days"] == 1
+    assert links[1]["time_of_max"] == "12:30"
+    assert links[1]["maximum_velocity"] == float("inf")
+
+
+MESSAGES_REPORT = """
+  EPA STORM WATER MANAGEMENT MODEL - VERSION 5.2 (Build 5.2.4)
+
+  WARNING 04: minimum elevation drop used for Conduit P003
+  ERROR 317: cannot open rainfall data file rain.dat.
+  Conduit ERROR 1 mentioned mid-line is not a message
+"""
+
+
+def test_swmm_report_errors_and_warnings(tmp_path):
+    """Test extraction of ERROR and WARNING message lines."""
+    rpt_file = tmp_path / "messages.rpt"
+    rpt_file.write_text(MESSAGES_REPORT)
+
+    data = SwmmReportDecoder().decode_file(rpt_file)
+
+    assert data["errors"] == ["ERROR 317: cannot open rainfall data file rain.dat."]
+    assert data["warnings"] == [
+        "WARNING 04: minimum elevation drop used for Conduit P003"
+    ]
+
+
+def test_swmm_report_decode_messages(tmp_path):
+    """Test the memory-mapped ERROR/WARNING scan matches decode_file."""
+    rpt_file = tmp_path / "messages.rpt"
+    rpt_file.write_text(MESSAGES_REPORT)
+    empty_file = tmp_path / "empty.rpt"
+    empty_file.write_text("")
+
+    decoder = SwmmReportDecoder()
+    data = decoder.decode_file(rpt_file)
+
+    assert decoder.decode_messages(rpt_file) == {
+        "errors": data["errors"],
+        "warnings": data["warnings"],
+    }
+    assert decoder.decode_messages(empty_file) == {"errors": [], "warnings": []}
+
+
+POLLUTANT_LOAD_REPORT = """
+  *****************************
+  Link Pollutant Load Summary
+  *****************************
+
+  ------------------------------------------
+                           TSS          Lead
+  Link                     lbs           lbs
+  ------------------------------------------
+  P001                  150.012         0.029
+  Link2                 225.050         0.044
+
+
+  ***********************
+  LID Performance Summary
+  ***********************
+"""
+
+
+def test_swmm_report_pollutant_loads(tmp_path):
+    """Test pollutant load rows are keyed by the header's pollutant names."""
+    rpt_file = tmp_path / "loads.rpt"
+    rpt_file.write_text(POLLUTANT_LOAD_REPORT)
+
+    loads = SwmmReportDecoder().decode_file(rpt_file)["link_pollutant_load"]
+
+    assert [row["link"] for row in loads] == ["P001", "Link2"]
+    assert loads[0]["data"] == ["150.012", "0.029"]
+    assert loads[1]["loads"] == {"TSS": 225.05, "Lead": 0.044}
+
+
+CONTINUITY_REPORT = """
+  EPA STORM WATER MANAGEMENT MODEL - VERSION 5.2 (Build 5.2.4)
+
+  **************************        Volume         Depth
+  Runoff Quantity Continuity     acre-feet        inches
+  **************************     ---------       -------
+  Total Precipitation ......         8.176         6.655
+  Surface Runoff ...........         5.088         4.142
+
+
+  **************************        Volume        Volume
+  Flow Routing Continuity        acre-feet      10^6 gal
+  **************************     ---------     ---------
+  Wet Weather Inflow .......         5.088         1.658
+  External Outflow .........         5.070         1.652
+
+
+  *************************
+  Conduit Surcharge Summary
+  *************************
+
+  No conduits were surcharged.
+
+  Analysis begun on:  Mon Jan 15 10:00:00 2024
+"""
+
+
+def test_swmm_report_decode_file_object():
+    """Test decoding a report section by section from a file object."""
+    data = SwmmReportDecoder().decode(io.StringIO(CONTINUITY_REPORT))
+
+    assert data["header"]["version"] == "5.2"
+    assert data["continuity"]["runoff_quantity"]["total_precipitation"] == [
+        pytest.approx(8.176),
+        pytest.approx(6.655),
+    ]
+    assert data["continuity"]["flow_routing"]["external_outflow"][0] == (
+        pytest.approx(5.07)
+    )
+    assert data["analysis_time"]["begun"] == "Mon Jan 15 10:00:00 2024"
+    assert data["link_flow"] == []
+    assert data["node_flooding"] is None